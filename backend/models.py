@@ -60,7 +60,7 @@ class SubsystemOut(BaseModel):
     name: str
     directory: str
     description: str
-    key_files: list[str] = []
+    key_files: list[str] = Field(default_factory=list)
 
 
 class RequestFlowStepOut(BaseModel):
@@ -73,8 +73,8 @@ class RequestFlowStepOut(BaseModel):
 class RequestFlowOut(BaseModel):
     name: str
     description: str
-    steps: list[RequestFlowStepOut] = []
-    touchpoints: list[str] = []
+    steps: list[RequestFlowStepOut] = Field(default_factory=list)
+    touchpoints: list[str] = Field(default_factory=list)
 
 
 class DependencyEdgeOut(BaseModel):
@@ -95,14 +95,14 @@ class DependencyNodeOut(BaseModel):
 
 class DependencyLayerOut(BaseModel):
     name: str
-    files: list[str] = []
+    files: list[str] = Field(default_factory=list)
     type: str = "module"
 
 
 class DependencyGraphOut(BaseModel):
-    nodes: list[DependencyNodeOut] = []
-    edges: list[DependencyEdgeOut] = []
-    layers: list[DependencyLayerOut] = []
+    nodes: list[DependencyNodeOut] = Field(default_factory=list)
+    edges: list[DependencyEdgeOut] = Field(default_factory=list)
+    layers: list[DependencyLayerOut] = Field(default_factory=list)
 
 
 class AnalysisResponse(BaseModel):
@@ -111,27 +111,27 @@ class AnalysisResponse(BaseModel):
     detailed_purpose: str = ""
     total_files: int = 0
     total_lines: int = 0
-    languages: dict[str, int] = {}
-    domain_entities: list[str] = []
-    api_endpoints: list[ApiEndpointOut] = []
-    frameworks: list[FrameworkOut] = []
-    entry_points: list[EntryPointOut] = []
-    subsystems: list[SubsystemOut] = []
-    risk_areas: list[RiskAreaOut] = []
-    patterns_detected: list[str] = []
+    languages: dict[str, int] = Field(default_factory=dict)
+    domain_entities: list[str] = Field(default_factory=list)
+    api_endpoints: list[ApiEndpointOut] = Field(default_factory=list)
+    frameworks: list[FrameworkOut] = Field(default_factory=list)
+    entry_points: list[EntryPointOut] = Field(default_factory=list)
+    subsystems: list[SubsystemOut] = Field(default_factory=list)
+    risk_areas: list[RiskAreaOut] = Field(default_factory=list)
+    patterns_detected: list[str] = Field(default_factory=list)
     request_flow: RequestFlowOut | None = None
-    first_read_files: list[dict] = []
-    skip_files: list[dict] = []
-    config_files: list[str] = []
-    env_vars: list[str] = []
-    dependency_graph: DependencyGraphOut = DependencyGraphOut()
+    first_read_files: list[dict] = Field(default_factory=list)
+    skip_files: list[dict] = Field(default_factory=list)
+    config_files: list[str] = Field(default_factory=list)
+    env_vars: list[str] = Field(default_factory=list)
+    dependency_graph: DependencyGraphOut = Field(default_factory=DependencyGraphOut)
 
 
 class AskKeywordResponse(BaseModel):
     question: str
     summary: str
-    details: list[str] = []
-    related_files: list[str] = []
+    details: list[str] = Field(default_factory=list)
+    related_files: list[str] = Field(default_factory=list)
     confidence: str = "high"
     mode: str = "keyword"
 
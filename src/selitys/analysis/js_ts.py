@@ -125,7 +125,7 @@ class JsTsAnalyzer:
                     attributes={
                         "method": method,
                         "path": path,
-                        "file": str(file_info.relative_path),
+                        "file": file_info.path_str,
                     },
                 )
             )
@@ -189,7 +189,7 @@ class JsTsAnalyzer:
         start_line = node.start_point[0] + 1 if node.start_point else None
         end_line = node.end_point[0] + 1 if node.end_point else None
         return Evidence(
-            file_path=str(file_info.relative_path),
+            file_path=file_info.path_str,
             line_start=start_line,
             line_end=end_line,
             symbol=symbol,
@@ -64,7 +64,7 @@ class PythonAstAnalyzer:
             route_facts.extend(self._route_facts(tree, file_info, router_prefixes))
             bundle.facts.extend(self._model_facts(tree, file_info))
 
-            import_map = self._build_import_map(tree, module_by_file.get(str(file_info.relative_path)))
+            import_map = self._build_import_map(tree, module_by_file.get(file_info.path_str))
             include_edges.extend(
                 self._include_router_edges(
                     tree,
@@ -84,7 +84,7 @@ class PythonAstAnalyzer:
         return (f for f in structure.files if f.extension == ".py")
 
     def _entry_point_facts(self, file_info: FileInfo) -> list[Fact]:
-        name = file_info.relative_path.name
+        name = file_info.name
         if name not in {"main.py", "app.py", "manage.py", "wsgi.py", "asgi.py"}:
             return []
 
@@ -101,8 +101,8 @@ class PythonAstAnalyzer:
                 kind=FactKind.ENTRY_POINT,
                 summary=description,
                 confidence=Confidence.HIGH,
-                evidence=[Evidence(file_path=str(file_info.relative_path), line_start=1, line_end=1)],
-                attributes={"file": str(file_info.relative_path)},
+                evidence=[Evidence(file_path=file_info.path_str, line_start=1, line_end=1)],
+                attributes={"file": file_info.path_str},
             )
         ]
 
@@ -112,7 +112,7 @@ class PythonAstAnalyzer:
         file_info: FileInfo,
         existing_entry_files: set[str | None],
     ) -> list[Fact]:
-        if str(file_info.relative_path) in existing_entry_files:
+        if file_info.path_str in existing_entry_files:
             return []
         for node in ast.walk(tree):
             if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
@@ -123,7 +123,7 @@ class PythonAstAnalyzer:
                             summary="FastAPI application instance",
                             confidence=Confidence.HIGH,
                             evidence=[self._evidence(file_info, node, symbol="FastAPI")],
-                            attributes={"file": str(file_info.relative_path)},
+                            attributes={"file": file_info.path_str},
                         )
                     ]
         return []
@@ -199,7 +199,7 @@ class PythonAstAnalyzer:
                                 "path": path,
                                 "handler": node.name,
                                 "router": router_name,
-                                "file": str(file_info.relative_path),
+                                "file": file_info.path_str,
                             },
                         )
                     )
@@ -228,7 +228,7 @@ class PythonAstAnalyzer:
                     attributes={
                         "class": node.name,
                         "table": table_name,
-                        "file": str(file_info.relative_path),
+                        "file": file_info.path_str,
                     },
                 )
             )
@@ -337,12 +337,12 @@ class PythonAstAnalyzer:
                 node.args[0],
                 import_map,
                 file_by_module,
-                str(file_info.relative_path),
+                file_info.path_str,
                 router_names,
             )
             if not child_file:
                 continue
-            edges.append(RouterInclude(source_file=str(file_info.relative_path), child_file=child_file, prefix=prefix))
+            edges.append(RouterInclude(source_file=file_info.path_str, child_file=child_file, prefix=prefix))
         return edges
 
     def _extract_prefix(self, node: ast.Call) -> str | None:
@@ -516,7 +516,7 @@ class PythonAstAnalyzer:
 
     def _evidence(self, file_info: FileInfo, node: ast.AST, symbol: str | None = None) -> Evidence:
         return Evidence(
-            file_path=str(file_info.relative_path),
+            file_path=file_info.path_str,
             line_start=getattr(node, "lineno", None),
             line_end=getattr(node, "end_lineno", None),
             symbol=symbol,
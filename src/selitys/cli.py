@@ -1,5 +1,6 @@
 """selitys CLI - A developer onboarding tool that explains backend codebases."""
 
+from itertools import islice
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -58,7 +59,8 @@ def run_analysis(
             table = Table(title="Languages Detected")
             table.add_column("Language", style="cyan")
             table.add_column("Lines", justify="right", style="green")
-            for lang, lines in list(structure.languages_detected.items())[:10]:
+            # languages_detected is already sorted by line count
+            for lang, lines in islice(structure.languages_detected.items(), 10):
                 table.add_row(lang, f"{lines:,}")
             console.print(table)
             console.print()
@@ -78,6 +80,8 @@ def run_analysis(
     else:
         analyzer = Analyzer(structure)
         analysis = analyzer.analyze()
+    # Output is generated from the analysis and file metadata only
+    structure.release_contents()
 
     # Generate markdown
     output_dir.mkdir(parents=True, exist_ok=True)
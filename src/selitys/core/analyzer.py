@@ -1,12 +1,245 @@
 """Analyzer - infers high-level information from scanned repository."""
 
+import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 from selitys.analysis.model import FactBundle
 from selitys.core.fact_pipeline import FactPipeline
 from selitys.core.scanner import RepoStructure
 
+JS_TS_EXTENSIONS = {".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"}
+# Source files considered for reading order and the dependency graph
+CODE_FILE_EXTENSIONS = {".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".java", ".rb", ".rs"}
+
+# (name, category, lowercase keyword, case-sensitive markers - any must match)
+FRAMEWORK_KEYWORDS = [
+    ("FastAPI", "Web Framework", "fastapi", ()),
+    ("Flask", "Web Framework", "from flask", ()),
+    ("Django", "Web Framework", "django", ()),
+    ("SQLAlchemy", "ORM", "sqlalchemy", ()),
+    ("Alembic", "Database Migrations", "alembic", ()),
+    ("Pydantic", "Data Validation", "pydantic", ()),
+    ("pytest", "Testing", "pytest", ()),
+    ("Celery", "Task Queue", "celery", ()),
+    ("Redis", "Cache/Message Broker", "redis", ()),
+]
+
+JS_FRAMEWORK_KEYWORDS = [
+    ("Express", "Web Framework (Node.js)", "express", ("require('express')", "from 'express'", 'from "express"')),
+    ("Next.js", "React Framework", "next", ("next/app", "next/router", "next/image")),
+    ("React", "UI Library", "react", ("from 'react'", 'from "react"')),
+    ("Vue.js", "UI Framework", "vue", ("from 'vue'", 'from "vue"')),
+    ("Angular", "UI Framework", "angular", ("@angular",)),
+    ("NestJS", "Web Framework (Node.js)", "nestjs", ()),
+    ("Prisma", "ORM (Node.js)", "prisma", ("@prisma/client", "PrismaClient")),
+    ("TypeORM", "ORM (Node.js)", "typeorm", ()),
+    ("Sequelize", "ORM (Node.js)", "sequelize", ()),
+    ("Mongoose", "MongoDB ODM", "mongoose", ()),
+    ("Jest", "Testing", "jest", ("from 'jest'", "describe(")),
+    ("Mocha", "Testing", "mocha", ()),
+    ("Vitest", "Testing", "vitest", ()),
+    ("Tailwind CSS", "CSS Framework", "tailwind", ()),
+    ("GraphQL", "API Query Language", "graphql", ()),
+    ("tRPC", "Type-safe API", "trpc", ()),
+]
+
+# (quoted dependency name, framework name, category) matched in package.json
+PACKAGE_JSON_FRAMEWORKS = [
+    ('"express"', "Express", "Web Framework (Node.js)"),
+    ('"next"', "Next.js", "React Framework"),
+    ('"react"', "React", "UI Library"),
+    ('"vue"', "Vue.js", "UI Framework"),
+    ('"@nestjs/core"', "NestJS", "Web Framework (Node.js)"),
+    ('"typescript"', "TypeScript", "Language"),
+]
+
+# File name -> (file type, description) for recognised configuration files
+CONFIG_FILE_PATTERNS = {
+    # Python
+    "config.py": ("Python", "Application configuration module"),
+    "settings.py": ("Python", "Django-style settings module"),
+    "pyproject.toml": ("TOML", "Python project configuration"),
+    "alembic.ini": ("INI", "Alembic database migration configuration"),
+    "pytest.ini": ("INI", "Pytest configuration"),
+    "setup.cfg": ("INI", "Python package configuration"),
+    # General
+    "config.yaml": ("YAML", "YAML configuration file"),
+    "config.yml": ("YAML", "YAML configuration file"),
+    "config.json": ("JSON", "JSON configuration file"),
+    ".env": ("Environment", "Environment variables file"),
+    ".env.example": ("Environment", "Example environment variables template"),
+    ".env.local": ("Environment", "Local environment overrides"),
+    # JavaScript/TypeScript
+    "package.json": ("JSON", "Node.js package configuration"),
+    "tsconfig.json": ("JSON", "TypeScript compiler configuration"),
+    "next.config.js": ("JavaScript", "Next.js configuration"),
+    "next.config.mjs": ("JavaScript", "Next.js configuration"),
+    "vite.config.ts": ("TypeScript", "Vite bundler configuration"),
+    "vite.config.js": ("JavaScript", "Vite bundler configuration"),
+    "webpack.config.js": ("JavaScript", "Webpack bundler configuration"),
+    "tailwind.config.js": ("JavaScript", "Tailwind CSS configuration"),
+    "tailwind.config.ts": ("TypeScript", "Tailwind CSS configuration"),
+    "jest.config.js": ("JavaScript", "Jest testing configuration"),
+    "jest.config.ts": ("TypeScript", "Jest testing configuration"),
+    ".eslintrc.js": ("JavaScript", "ESLint configuration"),
+    ".eslintrc.json": ("JSON", "ESLint configuration"),
+    ".prettierrc": ("JSON", "Prettier configuration"),
+    "prisma/schema.prisma": ("Prisma", "Prisma database schema"),
+}
+
+DIR_PURPOSES = {
+    "app": "Main application code",
+    "src": "Source code",
+    "lib": "Library code",
+    "api": "API routes and handlers",
+    "routes": "HTTP route definitions",
+    "models": "Data models and schemas",
+    "services": "Business logic and services",
+    "utils": "Utility functions",
+    "helpers": "Helper functions",
+    "core": "Core application logic",
+    "config": "Configuration files",
+    "tests": "Test files",
+    "test": "Test files",
+    "scripts": "Utility scripts",
+    "migrations": "Database migrations",
+    "alembic": "Alembic database migrations",
+    "static": "Static assets",
+    "templates": "Template files",
+    "docs": "Documentation",
+}
+
+FILE_PURPOSES = {
+    "main.py": "Application entry point",
+    "app.py": "Application factory",
+    "manage.py": "Django management script",
+    "setup.py": "Package setup (legacy)",
+    "pyproject.toml": "Project configuration and dependencies",
+    "requirements.txt": "Python dependencies",
+    "Pipfile": "Pipenv dependencies",
+    "poetry.lock": "Poetry lock file",
+    "uv.lock": "uv lock file",
+    "Makefile": "Build and task automation",
+    "Dockerfile": "Container definition",
+    "docker-compose.yml": "Container orchestration",
+    "docker-compose.yaml": "Container orchestration",
+    ".env": "Environment variables (local)",
+    ".env.example": "Environment variable template",
+    "README.md": "Project documentation",
+    "LICENSE": "License information",
+    "alembic.ini": "Alembic configuration",
+    ".gitignore": "Git ignore patterns",
+    "conftest.py": "pytest configuration and fixtures",
+}
+
+SUBSYSTEM_PATTERNS = {
+    "services": ("Services", "Business logic and service layer"),
+    "service": ("Services", "Business logic and service layer"),
+    "api": ("API Layer", "HTTP API handlers and endpoints"),
+    "routes": ("Routing", "HTTP route definitions"),
+    "models": ("Data Models", "Database models and entities"),
+    "schemas": ("Schemas", "Data validation and serialization schemas"),
+    "core": ("Core", "Core application configuration and utilities"),
+    "utils": ("Utilities", "Helper functions and utilities"),
+    "auth": ("Authentication", "Authentication and authorization"),
+    "db": ("Database", "Database connection and queries"),
+    "database": ("Database", "Database connection and queries"),
+    "middleware": ("Middleware", "Request/response middleware"),
+    "tasks": ("Background Tasks", "Async tasks and job processing"),
+    "workers": ("Workers", "Background job workers"),
+}
+
+ENTRY_POINT_FILES = {
+    # Python
+    "main.py": "Main application entry point",
+    "app.py": "Application factory or entry point",
+    "manage.py": "Django management script",
+    "wsgi.py": "WSGI application entry",
+    "asgi.py": "ASGI application entry",
+    # JavaScript/TypeScript
+    "index.js": "Application entry point",
+    "index.ts": "Application entry point",
+    "main.js": "Application entry point",
+    "main.ts": "Application entry point",
+    "server.js": "Server entry point",
+    "server.ts": "Server entry point",
+    "app.js": "Application entry point",
+    "app.ts": "Application entry point",
+    "app.tsx": "Application entry point",
+    # Next.js/React
+    "_app.tsx": "Next.js application wrapper",
+    "_app.js": "Next.js application wrapper",
+    "layout.tsx": "Next.js App Router layout",
+    "layout.js": "Next.js App Router layout",
+}
+# Generic JS/TS names only count as entry points at the root or src level
+SHALLOW_ENTRY_POINT_FILES = frozenset({
+    "index.js", "index.ts", "main.js", "main.ts", "app.js", "app.ts", "app.tsx",
+})
+
+# Substrings looked for in lowercased file paths by _infer_purpose / _detect_patterns
+PATH_KEYWORDS = (
+    "route", "api", "model", "database", "db", "auth", "component",
+    "service", "schema", "middleware", "dependencies",
+)
+# Substrings looked for in lowercased directory paths by _detect_patterns
+DIRECTORY_KEYWORDS = ("alembic", "migrations")
+
+# Config / environment variable patterns
+PY_SETTING_PATTERN = re.compile(r'^\s*[A-Z_]+\s*=', re.MULTILINE)
+ENV_SETTING_PATTERN = re.compile(r'^[A-Z_]+=', re.MULTILINE)
+GETENV_PATTERN = re.compile(r'os\.getenv\s*\(\s*["\']([^"\']+)["\'](?:\s*,\s*([^)]+))?\)')
+ENVIRON_PATTERN = re.compile(r'os\.environ\s*\[\s*["\']([^"\']+)["\']\s*\]')
+PYDANTIC_ENV_PATTERN = re.compile(r'(\w+)\s*:\s*\w+\s*=\s*Field\s*\([^)]*env\s*=\s*["\']([^"\']+)["\']')
+PROCESS_ENV_PATTERN = re.compile(r'process\.env\.([A-Z_][A-Z0-9_]*)')
+PROCESS_ENV_BRACKET_PATTERN = re.compile(r'process\.env\[["\']([A-Z_][A-Z0-9_]*)["\']')
+NEXT_PUBLIC_PATTERN = re.compile(r'(NEXT_PUBLIC_[A-Z0-9_]+)')
+
+# Risk detection
+MAX_RISK_AREAS = 30
+MAX_RISK_SCAN_CHARS = 1_000_000
+PARAMETERIZED_EXECUTE_PATTERN = re.compile(r'execute\s*\([^,]+,\s*[\[\(]')
+# Each pattern is paired with a lowercase literal it cannot match without, so
+# the regex only runs on files whose lowercased content contains that literal.
+# Patterns start with their literal (lookbehinds come after it) so the regex
+# engine can skip ahead to candidate positions instead of trying every offset.
+SECRET_PATTERNS = [
+    ("password", re.compile(r'password(?<!os\.environpassword)(?<!getenvpassword)\s*=\s*["\'][^"\']{4,}["\']', re.IGNORECASE), "hardcoded password"),
+    ("secret_key", re.compile(r'secret_key(?<!os\.environsecret_key)(?<!getenvsecret_key)\s*=\s*["\'][^"\']{8,}["\']', re.IGNORECASE), "hardcoded secret"),
+    ("api_key", re.compile(r'api_key(?<!os\.environapi_key)(?<!getenvapi_key)\s*=\s*["\'][^"\']{8,}["\']', re.IGNORECASE), "hardcoded API key"),
+    ("auth_token", re.compile(r'auth_token(?<!os\.environauth_token)(?<!getenvauth_token)\s*=\s*["\'][^"\']{20,}["\']', re.IGNORECASE), "hardcoded token"),
+    ("private_key", re.compile(r'private_key\s*=\s*["\'][^"\']{20,}["\']', re.IGNORECASE), "hardcoded private key"),
+    ("aws_secret_access_key", re.compile(r'AWS_SECRET_ACCESS_KEY\s*=\s*["\'][^"\']+["\']', re.IGNORECASE), "AWS secret key"),
+    ("private key-----", re.compile(r'-----BEGIN (RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----', re.IGNORECASE), "embedded private key"),
+    ("ghp_", re.compile(r'ghp_[a-zA-Z0-9]{36}', re.IGNORECASE), "GitHub personal access token"),
+    ("sk-", re.compile(r'sk-[a-zA-Z0-9]{48}', re.IGNORECASE), "OpenAI API key pattern"),
+]
+INSECURE_PATTERNS = [
+    ("debug", re.compile(r'DEBUG\s*=\s*True', re.IGNORECASE), "Debug mode enabled", "medium"),
+    ("verify", re.compile(r'verify\s*=\s*False', re.IGNORECASE), "SSL verification disabled", "high"),
+    ("allow_origins", re.compile(r'allow_origins\s*=\s*\["\*"\]', re.IGNORECASE), "Permissive CORS configuration", "medium"),
+    ("eval", re.compile(r'(?<!["\'])eval\s*\([^)]+\)', re.IGNORECASE), "Use of eval()", "high"),
+    ("exec", re.compile(r'(?<!["\'])exec\s*\([^)]+\)', re.IGNORECASE), "Use of exec()", "high"),
+    ("subprocess.", re.compile(r'subprocess\.(run|call|Popen).*shell\s*=\s*True', re.IGNORECASE), "Shell injection risk", "high"),
+    ("pickle.load", re.compile(r'pickle\.loads?\s*\(', re.IGNORECASE), "Pickle deserialization (potential RCE)", "medium"),
+    ("yaml.load", re.compile(r'yaml\.load\s*\([^)]*Loader\s*=\s*None', re.IGNORECASE), "Unsafe YAML load (use safe_load)", "medium"),
+    ("hashlib.", re.compile(r'hashlib\.md5\(|hashlib\.sha1\(', re.IGNORECASE), "Weak hash algorithm", "low"),
+]
+FUNC_DEF_PATTERN = re.compile(r'(async )?def\s+\w+\s*\([^)]*\)')
+TODO_PATTERN = re.compile(r'#\s*(TODO|FIXME|HACK|XXX|BUG)', re.IGNORECASE)
+
+# Dependency graph
+PY_FROM_IMPORT_PATTERN = re.compile(r'^from\s+([\w.]+)\s+import', re.MULTILINE)
+PY_IMPORT_PATTERN = re.compile(r'^import\s+([\w.]+)', re.MULTILINE)
+JS_IMPORT_PATTERN = re.compile(r"""(?:from|require\()\s*['"]([^'"]+)['"]""")
+
+# Data models
+SQLALCHEMY_MODEL_PATTERN = re.compile(r'class\s+(\w+)\s*\([^)]*Base[^)]*\)')
+TABLENAME_PATTERN = re.compile(r'__tablename__\s*=\s*["\'](\w+)["\']')
+
 
 @dataclass
 class EntryPoint:
@@ -171,29 +404,56 @@ class Analyzer:
         result.dependency_graph = self._build_dependency_graph(result)
         result.fact_bundle = FactPipeline().analyze(self.structure)
 
+        # Lowercase copies are only needed while analyzing; don't keep every
+        # file's content in memory twice for the lifetime of the structure.
+        self.structure.clear_content_caches()
+
         return result
 
+    @cached_property
+    def _path_keywords(self) -> frozenset[str]:
+        """PATH_KEYWORDS that occur in at least one file path, found in a single pass."""
+        hits: set[str] = set()
+        for f in self.structure.files:
+            for keyword in PATH_KEYWORDS:
+                if keyword not in hits and keyword in f.path_lower:
+                    hits.add(keyword)
+            if len(hits) == len(PATH_KEYWORDS):
+                break
+        return frozenset(hits)
+
+    @cached_property
+    def _directory_keywords(self) -> frozenset[str]:
+        """DIRECTORY_KEYWORDS that occur in at least one directory path."""
+        hits: set[str] = set()
+        for d in self.structure.directories:
+            path = str(d.relative_path).lower()
+            hits.update(keyword for keyword in DIRECTORY_KEYWORDS if keyword in path)
+            if len(hits) == len(DIRECTORY_KEYWORDS):
+                break
+        return frozenset(hits)
+
     def _infer_purpose(self) -> str:
         """Infer the likely purpose of this codebase."""
         indicators = []
+        keywords = self._path_keywords
 
         # Detect primary language
         langs = self.structure.languages_detected
         primary_lang = list(langs.keys())[0] if langs else "Unknown"
         is_js_ts = primary_lang in ["JavaScript", "TypeScript", "JavaScript (React)", "TypeScript (React)"]
 
-        has_api = any("route" in str(f.relative_path).lower() or "api" in str(f.relative_path).lower()
-                      for f in self.structure.files)
-        has_models = any("model" in str(f.relative_path).lower() for f in self.structure.files)
-        has_db = any("database" in str(f.relative_path).lower() or "db" in str(f.relative_path).lower()
-                     for f in self.structure.files)
-        has_auth = any("auth" in str(f.relative_path).lower() for f in self.structure.files)
+        has_api = "route" in keywords or "api" in keywords
+        has_models = "model" in keywords
+        has_db = "database" in keywords or "db" in keywords
+        has_auth = "auth" in keywords
 
         # JS/TS specific indicators
-        has_components = any("component" in str(f.relative_path).lower() for f in self.structure.files)
-        has_pages = any(f.relative_path.parent.name in ["pages", "app"] and f.extension in [".tsx", ".jsx", ".js", ".ts"]
-                       for f in self.structure.files)
-        has_package_json = any(f.relative_path.name == "package.json" for f in self.structure.files)
+        has_components = "component" in keywords
+        has_pages = any(f.relative_path.parent.name in ("pages", "app")
+                        for ext in (".tsx", ".jsx", ".js", ".ts")
+                        for f in self.structure.files_by_extension.get(ext, ()))
+        has_package_json = "package.json" in self.structure.files_by_name
 
         if has_components or has_pages:
             if is_js_ts:
@@ -215,282 +475,153 @@ class Analyzer:
 
     def _detect_frameworks(self) -> list[FrameworkInfo]:
         """Detect frameworks used in the codebase."""
-        frameworks = []
+        # Keyed by name so each framework is only searched for until first seen
+        found: dict[str, FrameworkInfo] = {}
 
         for f in self.structure.files:
             if f.content is None:
                 continue
 
-            content_lower = f.content.lower()
-
-            if "fastapi" in content_lower or "from fastapi" in content_lower:
-                frameworks.append(FrameworkInfo("FastAPI", "Web Framework"))
-            if "flask" in content_lower and "from flask" in content_lower:
-                frameworks.append(FrameworkInfo("Flask", "Web Framework"))
-            if "django" in content_lower:
-                frameworks.append(FrameworkInfo("Django", "Web Framework"))
-            if "sqlalchemy" in content_lower:
-                frameworks.append(FrameworkInfo("SQLAlchemy", "ORM"))
-            if "alembic" in content_lower or f.relative_path.name == "alembic.ini":
-                frameworks.append(FrameworkInfo("Alembic", "Database Migrations"))
-            if "pydantic" in content_lower:
-                frameworks.append(FrameworkInfo("Pydantic", "Data Validation"))
-            if "pytest" in content_lower:
-                frameworks.append(FrameworkInfo("pytest", "Testing"))
-            if "celery" in content_lower:
-                frameworks.append(FrameworkInfo("Celery", "Task Queue"))
-            if "redis" in content_lower:
-                frameworks.append(FrameworkInfo("Redis", "Cache/Message Broker"))
-
-            # JavaScript/TypeScript frameworks
-            if f.extension in [".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"]:
-                if "express" in content_lower and ("require('express')" in f.content or "from 'express'" in f.content or 'from "express"' in f.content):
-                    frameworks.append(FrameworkInfo("Express", "Web Framework (Node.js)"))
-                if "next" in content_lower and ("next/app" in f.content or "next/router" in f.content or "next/image" in f.content):
-                    frameworks.append(FrameworkInfo("Next.js", "React Framework"))
-                if "react" in content_lower and ("from 'react'" in f.content or 'from "react"' in f.content):
-                    frameworks.append(FrameworkInfo("React", "UI Library"))
-                if "vue" in content_lower and ("from 'vue'" in f.content or 'from "vue"' in f.content):
-                    frameworks.append(FrameworkInfo("Vue.js", "UI Framework"))
-                if "angular" in content_lower and "@angular" in f.content:
-                    frameworks.append(FrameworkInfo("Angular", "UI Framework"))
-                if "nestjs" in content_lower or "@nestjs" in f.content:
-                    frameworks.append(FrameworkInfo("NestJS", "Web Framework (Node.js)"))
-                if "prisma" in content_lower and ("@prisma/client" in f.content or "PrismaClient" in f.content):
-                    frameworks.append(FrameworkInfo("Prisma", "ORM (Node.js)"))
-                if "typeorm" in content_lower:
-                    frameworks.append(FrameworkInfo("TypeORM", "ORM (Node.js)"))
-                if "sequelize" in content_lower:
-                    frameworks.append(FrameworkInfo("Sequelize", "ORM (Node.js)"))
-                if "mongoose" in content_lower:
-                    frameworks.append(FrameworkInfo("Mongoose", "MongoDB ODM"))
-                if "jest" in content_lower and ("from 'jest'" in f.content or "describe(" in f.content):
-                    frameworks.append(FrameworkInfo("Jest", "Testing"))
-                if "mocha" in content_lower:
-                    frameworks.append(FrameworkInfo("Mocha", "Testing"))
-                if "vitest" in content_lower:
-                    frameworks.append(FrameworkInfo("Vitest", "Testing"))
-                if "tailwind" in content_lower:
-                    frameworks.append(FrameworkInfo("Tailwind CSS", "CSS Framework"))
-                if "graphql" in content_lower:
-                    frameworks.append(FrameworkInfo("GraphQL", "API Query Language"))
-                if "trpc" in content_lower or "@trpc" in f.content:
-                    frameworks.append(FrameworkInfo("tRPC", "Type-safe API"))
+            is_js_ts = f.extension in JS_TS_EXTENSIONS
+            pending = [rule for rule in FRAMEWORK_KEYWORDS if rule[0] not in found]
+            if is_js_ts:
+                pending += [rule for rule in JS_FRAMEWORK_KEYWORDS if rule[0] not in found]
+
+            if pending:
+                for name, category, keyword, markers in pending:
+                    if keyword in f.content_lower and (not markers or any(m in f.content for m in markers)):
+                        found[name] = FrameworkInfo(name, category)
+
+            if "Alembic" not in found and f.name == "alembic.ini":
+                found["Alembic"] = FrameworkInfo("Alembic", "Database Migrations")
 
             # Check package.json for dependencies
-            if f.relative_path.name == "package.json":
-                if '"express"' in f.content:
-                    frameworks.append(FrameworkInfo("Express", "Web Framework (Node.js)"))
-                if '"next"' in f.content:
-                    frameworks.append(FrameworkInfo("Next.js", "React Framework"))
-                if '"react"' in f.content:
-                    frameworks.append(FrameworkInfo("React", "UI Library"))
-                if '"vue"' in f.content:
-                    frameworks.append(FrameworkInfo("Vue.js", "UI Framework"))
-                if '"@nestjs/core"' in f.content:
-                    frameworks.append(FrameworkInfo("NestJS", "Web Framework (Node.js)"))
-                if '"typescript"' in f.content:
-                    frameworks.append(FrameworkInfo("TypeScript", "Language"))
-
-        seen = set()
-        unique = []
-        for fw in frameworks:
-            if fw.name not in seen:
-                seen.add(fw.name)
-                unique.append(fw)
-
-        return unique
+            if f.name == "package.json":
+                for dependency, name, category in PACKAGE_JSON_FRAMEWORKS:
+                    if name not in found and dependency in f.content:
+                        found[name] = FrameworkInfo(name, category)
+
+        return list(found.values())
 
     def _find_entry_points(self) -> list[EntryPoint]:
         """Find application entry points."""
         entry_points = []
 
-        for f in self.structure.files:
-            name = f.relative_path.name
+        for f in self.structure.find_files(ENTRY_POINT_FILES):
+            name = f.name
+            if name in SHALLOW_ENTRY_POINT_FILES and len(f.relative_path.parts) > 2:
+                continue
+            if name.startswith("layout.") and f.relative_path.parent.name != "app":
+                continue
 
-            # Python entry points
+            desc = ENTRY_POINT_FILES[name]
             if name == "main.py":
-                desc = "Main application entry point"
-                if f.content and "uvicorn" in f.content.lower():
+                if "uvicorn" in f.content_lower:
                     desc = "ASGI server entry point (likely runs with uvicorn)"
-                entry_points.append(EntryPoint(str(f.relative_path), desc))
-
-            elif name == "app.py":
-                entry_points.append(EntryPoint(str(f.relative_path), "Application factory or entry point"))
-
-            elif name == "manage.py":
-                entry_points.append(EntryPoint(str(f.relative_path), "Django management script"))
-
-            elif name == "wsgi.py":
-                entry_points.append(EntryPoint(str(f.relative_path), "WSGI application entry"))
-
-            elif name == "asgi.py":
-                entry_points.append(EntryPoint(str(f.relative_path), "ASGI application entry"))
-
-            # JavaScript/TypeScript entry points
-            elif name in ["index.js", "index.ts", "main.js", "main.ts"]:
-                if len(f.relative_path.parts) <= 2:  # Root or src level
-                    desc = "Application entry point"
-                    if f.content:
-                        if "express" in f.content.lower():
-                            desc = "Express server entry point"
-                        elif "createServer" in f.content:
-                            desc = "HTTP server entry point"
-                    entry_points.append(EntryPoint(str(f.relative_path), desc))
-
-            elif name == "server.js" or name == "server.ts":
-                entry_points.append(EntryPoint(str(f.relative_path), "Server entry point"))
-
-            elif name in ["app.js", "app.ts", "app.tsx"]:
-                if len(f.relative_path.parts) <= 2:
-                    entry_points.append(EntryPoint(str(f.relative_path), "Application entry point"))
-
-            # Next.js/React entry points
-            elif name in ["_app.tsx", "_app.js"]:
-                entry_points.append(EntryPoint(str(f.relative_path), "Next.js application wrapper"))
-
-            elif name in ["layout.tsx", "layout.js"] and f.relative_path.parent.name == "app":
-                entry_points.append(EntryPoint(str(f.relative_path), "Next.js App Router layout"))
+            elif name in ("index.js", "index.ts", "main.js", "main.ts") and f.content:
+                if "express" in f.content_lower:
+                    desc = "Express server entry point"
+                elif "createServer" in f.content:
+                    desc = "HTTP server entry point"
+            entry_points.append(EntryPoint(f.path_str, desc))
 
         return entry_points
 
     def _analyze_config(self) -> ConfigInfo:
         """Analyze configuration files and environment variables."""
-        import re
         config = ConfigInfo()
 
-        config_patterns = {
-            # Python
-            "config.py": ("Python", "Application configuration module"),
-            "settings.py": ("Python", "Django-style settings module"),
-            "pyproject.toml": ("TOML", "Python project configuration"),
-            "alembic.ini": ("INI", "Alembic database migration configuration"),
-            "pytest.ini": ("INI", "Pytest configuration"),
-            "setup.cfg": ("INI", "Python package configuration"),
-            # General
-            "config.yaml": ("YAML", "YAML configuration file"),
-            "config.yml": ("YAML", "YAML configuration file"),
-            "config.json": ("JSON", "JSON configuration file"),
-            ".env": ("Environment", "Environment variables file"),
-            ".env.example": ("Environment", "Example environment variables template"),
-            ".env.local": ("Environment", "Local environment overrides"),
-            # JavaScript/TypeScript
-            "package.json": ("JSON", "Node.js package configuration"),
-            "tsconfig.json": ("JSON", "TypeScript compiler configuration"),
-            "next.config.js": ("JavaScript", "Next.js configuration"),
-            "next.config.mjs": ("JavaScript", "Next.js configuration"),
-            "vite.config.ts": ("TypeScript", "Vite bundler configuration"),
-            "vite.config.js": ("JavaScript", "Vite bundler configuration"),
-            "webpack.config.js": ("JavaScript", "Webpack bundler configuration"),
-            "tailwind.config.js": ("JavaScript", "Tailwind CSS configuration"),
-            "tailwind.config.ts": ("TypeScript", "Tailwind CSS configuration"),
-            "jest.config.js": ("JavaScript", "Jest testing configuration"),
-            "jest.config.ts": ("TypeScript", "Jest testing configuration"),
-            ".eslintrc.js": ("JavaScript", "ESLint configuration"),
-            ".eslintrc.json": ("JSON", "ESLint configuration"),
-            ".prettierrc": ("JSON", "Prettier configuration"),
-            "prisma/schema.prisma": ("Prisma", "Prisma database schema"),
-        }
+        for f in self.structure.find_files(CONFIG_FILE_PATTERNS):
+            config.config_files.append(f.path_str)
+            ftype, desc = CONFIG_FILE_PATTERNS[f.name]
+            settings_count = 0
+            if f.content:
+                if f.extension == ".py":
+                    settings_count = len(PY_SETTING_PATTERN.findall(f.content))
+                elif f.extension in [".env", ""]:
+                    settings_count = len(ENV_SETTING_PATTERN.findall(f.content))
+            config.config_file_details.append(ConfigFileInfo(
+                path=f.path_str,
+                file_type=ftype,
+                description=desc,
+                settings_count=settings_count,
+            ))
 
+        # Keyed by name: first sighting wins, insertion order is report order
+        env_vars: dict[str, EnvVarInfo] = {}
         for f in self.structure.files:
-            fname = f.relative_path.name
-            if fname in config_patterns:
-                config.config_files.append(str(f.relative_path))
-                ftype, desc = config_patterns[fname]
-                settings_count = 0
-                if f.content:
-                    if f.extension == ".py":
-                        settings_count = len(re.findall(r'^\s*[A-Z_]+\s*=', f.content, re.MULTILINE))
-                    elif f.extension in [".env", ""]:
-                        settings_count = len(re.findall(r'^[A-Z_]+=', f.content, re.MULTILINE))
-                config.config_file_details.append(ConfigFileInfo(
-                    path=str(f.relative_path),
-                    file_type=ftype,
-                    description=desc,
-                    settings_count=settings_count,
-                ))
-
             if f.content and f.extension == ".py":
                 # Find env vars with getenv (with potential default)
-                getenv_matches = re.findall(
-                    r'os\.getenv\s*\(\s*["\']([^"\']+)["\'](?:\s*,\s*([^)]+))?\)',
-                    f.content
-                )
+                getenv_matches = GETENV_PATTERN.findall(f.content)
                 for var, default in getenv_matches:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
+                    if var not in env_vars:
                         has_default = bool(default and default.strip())
-                        config.env_var_details.append(EnvVarInfo(
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=has_default,
                             default_value=default.strip() if has_default else "",
-                        ))
+                        )
 
                 # Find env vars with environ[]
-                environ_matches = re.findall(r'os\.environ\s*\[\s*["\']([^"\']+)["\']\s*\]', f.content)
+                environ_matches = ENVIRON_PATTERN.findall(f.content)
                 for var in environ_matches:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
-                        config.env_var_details.append(EnvVarInfo(
+                    if var not in env_vars:
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=False,
                             description="Required - no default provided",
-                        ))
+                        )
 
                 # Find pydantic settings fields
-                settings_matches = re.findall(
-                    r'(\w+)\s*:\s*\w+\s*=\s*Field\s*\([^)]*env\s*=\s*["\']([^"\']+)["\']',
-                    f.content
-                )
+                settings_matches = PYDANTIC_ENV_PATTERN.findall(f.content)
                 for field_name, var in settings_matches:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
-                        config.env_var_details.append(EnvVarInfo(
+                    if var not in env_vars:
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=True,
                             description=f"Pydantic settings field: {field_name}",
-                        ))
+                        )
 
             # JavaScript/TypeScript env var detection
-            if f.content and f.extension in [".js", ".ts", ".jsx", ".tsx", ".mjs", ".cjs"]:
+            if f.content and f.extension in JS_TS_EXTENSIONS:
                 # process.env.VAR_NAME
-                process_env_matches = re.findall(r'process\.env\.([A-Z_][A-Z0-9_]*)', f.content)
+                process_env_matches = PROCESS_ENV_PATTERN.findall(f.content)
                 for var in process_env_matches:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
-                        config.env_var_details.append(EnvVarInfo(
+                    if var not in env_vars:
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=False,
                             description="Node.js environment variable",
-                        ))
+                        )
 
                 # process.env["VAR_NAME"] or process.env['VAR_NAME']
-                process_env_bracket = re.findall(r'process\.env\[["\']([A-Z_][A-Z0-9_]*)["\']', f.content)
+                process_env_bracket = PROCESS_ENV_BRACKET_PATTERN.findall(f.content)
                 for var in process_env_bracket:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
-                        config.env_var_details.append(EnvVarInfo(
+                    if var not in env_vars:
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=False,
                             description="Node.js environment variable",
-                        ))
+                        )
 
                 # Next.js public env vars (NEXT_PUBLIC_*)
-                next_public = re.findall(r'(NEXT_PUBLIC_[A-Z0-9_]+)', f.content)
+                next_public = NEXT_PUBLIC_PATTERN.findall(f.content)
                 for var in next_public:
-                    if var not in config.env_vars:
-                        config.env_vars.append(var)
-                        config.env_var_details.append(EnvVarInfo(
+                    if var not in env_vars:
+                        env_vars[var] = EnvVarInfo(
                             name=var,
-                            source_file=str(f.relative_path),
+                            source_file=f.path_str,
                             has_default=False,
                             description="Next.js public environment variable (exposed to browser)",
-                        ))
+                        )
+
+        config.env_vars = list(env_vars)
+        config.env_var_details = list(env_vars.values())
 
         return config
 
@@ -499,32 +630,10 @@ class Analyzer:
         descriptions = {}
         root_dirs, _ = self.structure.get_top_level_items()
 
-        dir_purposes = {
-            "app": "Main application code",
-            "src": "Source code",
-            "lib": "Library code",
-            "api": "API routes and handlers",
-            "routes": "HTTP route definitions",
-            "models": "Data models and schemas",
-            "services": "Business logic and services",
-            "utils": "Utility functions",
-            "helpers": "Helper functions",
-            "core": "Core application logic",
-            "config": "Configuration files",
-            "tests": "Test files",
-            "test": "Test files",
-            "scripts": "Utility scripts",
-            "migrations": "Database migrations",
-            "alembic": "Alembic database migrations",
-            "static": "Static assets",
-            "templates": "Template files",
-            "docs": "Documentation",
-        }
-
         for d in root_dirs:
             name = d.relative_path.name.lower()
-            if name in dir_purposes:
-                descriptions[str(d.relative_path)] = dir_purposes[name]
+            if name in DIR_PURPOSES:
+                descriptions[str(d.relative_path)] = DIR_PURPOSES[name]
             else:
                 descriptions[str(d.relative_path)] = f"Contains {d.file_count} files"
 
@@ -535,35 +644,12 @@ class Analyzer:
         descriptions = {}
         _, root_files = self.structure.get_top_level_items()
 
-        file_purposes = {
-            "main.py": "Application entry point",
-            "app.py": "Application factory",
-            "manage.py": "Django management script",
-            "setup.py": "Package setup (legacy)",
-            "pyproject.toml": "Project configuration and dependencies",
-            "requirements.txt": "Python dependencies",
-            "Pipfile": "Pipenv dependencies",
-            "poetry.lock": "Poetry lock file",
-            "uv.lock": "uv lock file",
-            "Makefile": "Build and task automation",
-            "Dockerfile": "Container definition",
-            "docker-compose.yml": "Container orchestration",
-            "docker-compose.yaml": "Container orchestration",
-            ".env": "Environment variables (local)",
-            ".env.example": "Environment variable template",
-            "README.md": "Project documentation",
-            "LICENSE": "License information",
-            "alembic.ini": "Alembic configuration",
-            ".gitignore": "Git ignore patterns",
-            "conftest.py": "pytest configuration and fixtures",
-        }
-
         for f in root_files:
-            name = f.relative_path.name
-            if name in file_purposes:
-                descriptions[str(f.relative_path)] = file_purposes[name]
+            name = f.name
+            if name in FILE_PURPOSES:
+                descriptions[f.path_str] = FILE_PURPOSES[name]
             else:
-                descriptions[str(f.relative_path)] = f"{f.extension or 'unknown'} file ({f.line_count} lines)"
+                descriptions[f.path_str] = f"{f.extension or 'unknown'} file ({f.line_count} lines)"
 
         return descriptions
 
@@ -571,34 +657,12 @@ class Analyzer:
         """Detect major subsystems in the codebase."""
         subsystems = []
 
-        subsystem_patterns = {
-            "services": ("Services", "Business logic and service layer"),
-            "service": ("Services", "Business logic and service layer"),
-            "api": ("API Layer", "HTTP API handlers and endpoints"),
-            "routes": ("Routing", "HTTP route definitions"),
-            "models": ("Data Models", "Database models and entities"),
-            "schemas": ("Schemas", "Data validation and serialization schemas"),
-            "core": ("Core", "Core application configuration and utilities"),
-            "utils": ("Utilities", "Helper functions and utilities"),
-            "auth": ("Authentication", "Authentication and authorization"),
-            "db": ("Database", "Database connection and queries"),
-            "database": ("Database", "Database connection and queries"),
-            "middleware": ("Middleware", "Request/response middleware"),
-            "tasks": ("Background Tasks", "Async tasks and job processing"),
-            "workers": ("Workers", "Background job workers"),
-        }
-
         seen_names = set()
         for d in self.structure.directories:
             dir_name = d.relative_path.name.lower()
-            if dir_name in subsystem_patterns and dir_name not in seen_names:
-                name, desc = subsystem_patterns[dir_name]
-                key_files = [
-                    str(f.relative_path) for f in self.structure.files
-                    if str(f.relative_path).startswith(str(d.relative_path) + "/")
-                    and f.extension == ".py"
-                    and "__init__" not in f.relative_path.name
-                ][:5]
+            if dir_name in SUBSYSTEM_PATTERNS and dir_name not in seen_names:
+                name, desc = SUBSYSTEM_PATTERNS[dir_name]
+                key_files = self._python_files_under(str(d.relative_path))[:5]
 
                 subsystems.append(Subsystem(
                     name=name,
@@ -610,66 +674,89 @@ class Analyzer:
 
         return subsystems
 
+    @cached_property
+    def _sorted_python_paths(self) -> list[tuple[str, int]]:
+        """(path, scan position) for every non-__init__ .py file, sorted by path string."""
+        return sorted(
+            (f.path_str, position)
+            for position, f in enumerate(self.structure.files)
+            if f.extension == ".py" and "__init__" not in f.name
+        )
+
+    def _python_files_under(self, directory: str) -> list[str]:
+        """Python files below *directory*, in scan order, via a prefix range lookup."""
+        paths = self._sorted_python_paths
+        # "0" sorts immediately after "/", so this brackets every "<directory>/..." path
+        lo = bisect_left(paths, (directory + "/",))
+        hi = bisect_left(paths, (directory + "0",), lo)
+        return [path for path, _ in sorted(paths[lo:hi], key=lambda item: item[1])]
+
     def _detect_risk_areas(self) -> list[RiskArea]:
         """Detect risky or fragile areas in the codebase."""
-        import re
-        risks = []
+        risks: list[RiskArea] = []
+        seen: set[tuple[str, str]] = set()
+        severity_counts = {"high": 0, "medium": 0, "low": 0}
 
-        for f in self.structure.files:
-            if f.content is None:
-                continue
+        def _add(risk: RiskArea) -> None:
+            key = (risk.location, risk.risk_type)
+            if key not in seen:
+                seen.add(key)
+                risks.append(risk)
+                severity_counts[risk.severity] += 1
 
-            # Skip non-code files for most checks
-            is_code = f.extension in [".py", ".js", ".ts", ".java", ".go", ".rb"]
+        for f in self.structure.files:
+            # Results are ordered by severity and capped, so once the cap is
+            # filled by high-severity risks nothing found later can be reported,
+            # and low-severity checks are pointless once high + medium fill it.
+            if severity_counts["high"] >= MAX_RISK_AREAS:
+                break
+            want_low = severity_counts["high"] + severity_counts["medium"] < MAX_RISK_AREAS
 
-            # Large files
-            if f.line_count > 500:
-                risks.append(RiskArea(
-                    location=str(f.relative_path),
+            # Large files (needs only the line count, not the content)
+            if want_low and f.line_count > 500:
+                _add(RiskArea(
+                    location=f.path_str,
                     risk_type="Large file",
                     description=f"File has {f.line_count} lines, may be difficult to maintain",
                     severity="low",
                 ))
 
-            if not is_code:
+            if f.content is None:
+                continue
+
+            # Skip non-code files for most checks
+            is_code = f.extension in [".py", ".js", ".ts", ".java", ".go", ".rb"]
+
+            # Minified bundles and very large files produce noise and make the
+            # regex checks below slow; only the size check above applies to them
+            if not is_code or ".min." in f.name or len(f.content) > MAX_RISK_SCAN_CHARS:
                 continue
 
             # Raw SQL - potential injection
             if "execute(" in f.content and ("SELECT" in f.content or "INSERT" in f.content or "UPDATE" in f.content or "DELETE" in f.content):
                 # Check if it uses parameterized queries
-                if not re.search(r'execute\s*\([^,]+,\s*[\[\(]', f.content):
-                    risks.append(RiskArea(
-                        location=str(f.relative_path),
+                if not PARAMETERIZED_EXECUTE_PATTERN.search(f.content):
+                    _add(RiskArea(
+                        location=f.path_str,
                         risk_type="Possible SQL injection",
                         description="Raw SQL execution without apparent parameterization detected",
                         severity="high",
                     ))
 
             # Hardcoded secrets patterns (skip if looks like env var reference)
-            secret_patterns = [
-                (r'(?<!os\.environ)(?<!getenv)password\s*=\s*["\'][^"\']{4,}["\']', "hardcoded password"),
-                (r'(?<!os\.environ)(?<!getenv)secret_key\s*=\s*["\'][^"\']{8,}["\']', "hardcoded secret"),
-                (r'(?<!os\.environ)(?<!getenv)api_key\s*=\s*["\'][^"\']{8,}["\']', "hardcoded API key"),
-                (r'(?<!os\.environ)(?<!getenv)auth_token\s*=\s*["\'][^"\']{20,}["\']', "hardcoded token"),
-                (r'private_key\s*=\s*["\'][^"\']{20,}["\']', "hardcoded private key"),
-                (r'AWS_SECRET_ACCESS_KEY\s*=\s*["\'][^"\']+["\']', "AWS secret key"),
-                (r'-----BEGIN (RSA |EC |DSA |OPENSSH )?PRIVATE KEY-----', "embedded private key"),
-                (r'ghp_[a-zA-Z0-9]{36}', "GitHub personal access token"),
-                (r'sk-[a-zA-Z0-9]{48}', "OpenAI API key pattern"),
-            ]
-            for pattern, desc in secret_patterns:
-                if re.search(pattern, f.content, re.IGNORECASE):
+            for literal, pattern, desc in SECRET_PATTERNS:
+                if literal in f.content_lower and pattern.search(f.content):
                     # Skip if in test file or example
-                    if "test" in str(f.relative_path).lower() or "example" in str(f.relative_path).lower():
-                        risks.append(RiskArea(
-                            location=str(f.relative_path),
+                    if "test" in f.path_lower or "example" in f.path_lower:
+                        _add(RiskArea(
+                            location=f.path_str,
                             risk_type=f"Possible {desc}",
                             description=f"Found {desc} pattern in test/example file - verify it is not a real credential",
                             severity="medium",
                         ))
                     else:
-                        risks.append(RiskArea(
-                            location=str(f.relative_path),
+                        _add(RiskArea(
+                            location=f.path_str,
                             risk_type=f"Possible {desc}",
                             description=f"Detected pattern matching {desc} - review for exposed credentials",
                             severity="high",
@@ -677,116 +764,105 @@ class Analyzer:
                     break
 
             # Insecure configurations
-            insecure_patterns = [
-                (r'DEBUG\s*=\s*True', "Debug mode enabled", "medium"),
-                (r'verify\s*=\s*False', "SSL verification disabled", "high"),
-                (r'allow_origins\s*=\s*\["\*"\]', "Permissive CORS configuration", "medium"),
-                (r'(?<!["\'])eval\s*\([^)]+\)', "Use of eval()", "high"),
-                (r'(?<!["\'])exec\s*\([^)]+\)', "Use of exec()", "high"),
-                (r'subprocess\.(run|call|Popen).*shell\s*=\s*True', "Shell injection risk", "high"),
-                (r'pickle\.loads?\s*\(', "Pickle deserialization (potential RCE)", "medium"),
-                (r'yaml\.load\s*\([^)]*Loader\s*=\s*None', "Unsafe YAML load (use safe_load)", "medium"),
-                (r'hashlib\.md5\(|hashlib\.sha1\(', "Weak hash algorithm", "low"),
-            ]
-            for pattern, desc, severity in insecure_patterns:
-                if re.search(pattern, f.content, re.IGNORECASE):
-                    risks.append(RiskArea(
-                        location=str(f.relative_path),
+            for literal, pattern, desc, severity in INSECURE_PATTERNS:
+                if severity == "low" and not want_low:
+                    continue
+                if literal in f.content_lower and pattern.search(f.content):
+                    _add(RiskArea(
+                        location=f.path_str,
                         risk_type=desc,
                         description=f"Detected {desc} - review for security implications",
                         severity=severity,
                     ))
 
+            if not want_low:
+                continue
+
             # Missing input validation hints
-            if f.extension == ".py" and "route" in str(f.relative_path).lower():
+            if f.extension == ".py" and "route" in f.path_lower and "def" in f.content:
                 # Check if route handlers have type hints (basic validation)
-                func_defs = re.findall(r'(async )?def\s+\w+\s*\([^)]*\)', f.content)
+                func_defs = FUNC_DEF_PATTERN.findall(f.content)
                 untyped = [fd for fd in func_defs if ':' not in fd and 'self' not in fd]
                 if len(untyped) > 3:
-                    risks.append(RiskArea(
-                        location=str(f.relative_path),
+                    _add(RiskArea(
+                        location=f.path_str,
                         risk_type="Missing type hints in routes",
                         description=f"Found {len(untyped)} route handlers without type hints - reduces validation",
                         severity="low",
                     ))
 
             # TODO/FIXME/HACK comments
-            todo_count = len(re.findall(r'#\s*(TODO|FIXME|HACK|XXX|BUG)', f.content, re.IGNORECASE))
+            todo_count = len(TODO_PATTERN.findall(f.content)) if "#" in f.content else 0
             if todo_count > 5:
-                risks.append(RiskArea(
-                    location=str(f.relative_path),
+                _add(RiskArea(
+                    location=f.path_str,
                     risk_type="Technical debt markers",
                     description=f"Contains {todo_count} TODO/FIXME/HACK comments indicating unfinished work",
                     severity="low",
                 ))
 
         # Check test coverage
-        test_files = [f for f in self.structure.files if "test" in str(f.relative_path).lower() and f.extension == ".py"]
-        code_files = [f for f in self.structure.files if f.extension == ".py" and "test" not in str(f.relative_path).lower()]
+        test_count = code_count = 0
+        for f in self.structure.files_by_extension.get(".py", ()):
+            if "test" in f.path_lower:
+                test_count += 1
+            else:
+                code_count += 1
 
-        if code_files and len(test_files) < len(code_files) * 0.2:
-            risks.append(RiskArea(
+        if code_count and test_count < code_count * 0.2:
+            _add(RiskArea(
                 location="tests/",
                 risk_type="Limited test coverage",
-                description=f"Only {len(test_files)} test files for {len(code_files)} code files (ratio: {len(test_files)/len(code_files)*100:.0f}%)",
+                description=f"Only {test_count} test files for {code_count} code files (ratio: {test_count/code_count*100:.0f}%)",
                 severity="medium",
             ))
 
         # Check for missing security headers in FastAPI/Flask
-        main_files = [f for f in self.structure.files if f.relative_path.name == "main.py" and f.content]
+        main_files = [f for f in self.structure.files_by_name.get("main.py", ()) if f.content]
         for mf in main_files:
             if "FastAPI" in mf.content or "Flask" in mf.content:
                 if "SecurityMiddleware" not in mf.content and "Strict-Transport-Security" not in mf.content:
-                    risks.append(RiskArea(
-                        location=str(mf.relative_path),
+                    _add(RiskArea(
+                        location=mf.path_str,
                         risk_type="Missing security headers",
                         description="No security middleware detected - consider adding HSTS, CSP headers",
                         severity="low",
                     ))
 
-        # Deduplicate and limit
-        seen = set()
-        unique_risks = []
-        for r in risks:
-            key = (r.location, r.risk_type)
-            if key not in seen:
-                seen.add(key)
-                unique_risks.append(r)
-
         # Sort by severity
         severity_order = {"high": 0, "medium": 1, "low": 2}
-        unique_risks.sort(key=lambda r: severity_order.get(r.severity, 3))
+        risks.sort(key=lambda r: severity_order.get(r.severity, 3))
 
-        return unique_risks[:30]
+        return risks[:MAX_RISK_AREAS]
 
     def _detect_patterns(self) -> list[str]:
         """Detect architectural patterns in the codebase."""
         patterns = []
+        keywords = self._path_keywords
 
-        has_routes = any("route" in str(f.relative_path).lower() for f in self.structure.files)
-        has_services = any("service" in str(f.relative_path).lower() for f in self.structure.files)
-        has_models = any("model" in str(f.relative_path).lower() for f in self.structure.files)
+        has_routes = "route" in keywords
+        has_services = "service" in keywords
+        has_models = "model" in keywords
 
         if has_routes and has_services and has_models:
             patterns.append("Layered architecture (routes -> services -> models)")
 
-        has_deps = any("dependencies" in str(f.relative_path).lower() or
-                      (f.content and "Depends(" in f.content if f.content else False)
-                      for f in self.structure.files)
+        # FastAPI's Depends() only means something in Python sources (not docs)
+        has_deps = "dependencies" in keywords or any(
+            f.content and "Depends(" in f.content for f in self.structure.files_by_extension.get(".py", ())
+        )
         if has_deps:
             patterns.append("Dependency injection")
 
-        has_schemas = any("schema" in str(f.relative_path).lower() for f in self.structure.files)
+        has_schemas = "schema" in keywords
         if has_schemas:
             patterns.append("Request/response schema validation")
 
-        has_migrations = any("alembic" in str(f.relative_path).lower() or
-                            "migrations" in str(f.relative_path).lower()
-                            for f in self.structure.directories)
+        has_migrations = bool(self._directory_keywords)
         if has_migrations:
             patterns.append("Database migrations")
 
-        has_middleware = any("middleware" in str(f.relative_path).lower() for f in self.structure.files)
+        has_middleware = "middleware" in keywords
         if has_middleware:
             patterns.append("Middleware pattern")
 
@@ -794,7 +870,6 @@ class Analyzer:
 
     def _trace_request_flow(self) -> RequestFlow | None:
         """Trace a typical request through the system with detailed analysis."""
-        import re
         steps = []
         touchpoints = []
         order = 1
@@ -802,10 +877,10 @@ class Analyzer:
         # Find entry point
         entry_file = None
         for f in self.structure.files:
-            if f.relative_path.name == "main.py" and len(f.relative_path.parts) <= 2:
+            if f.name == "main.py" and len(f.relative_path.parts) <= 2:
                 entry_file = f
                 break
-            elif "app" in str(f.relative_path).lower() and f.relative_path.name == "main.py":
+            elif "app" in f.path_lower and f.name == "main.py":
                 entry_file = f
 
         if not entry_file:
@@ -830,7 +905,7 @@ class Analyzer:
             order=order,
             location="Application Entry",
             description="HTTP request arrives at the ASGI server (uvicorn/gunicorn) which delegates to the FastAPI application instance.",
-            file_path=str(entry_file.relative_path),
+            file_path=entry_file.path_str,
             code_insight=entry_insight,
             what_happens=entry_what or "The FastAPI app receives the request and begins the routing process.",
             key_functions=entry_funcs,
@@ -839,7 +914,7 @@ class Analyzer:
         touchpoints.append(f"Entry: {entry_file.relative_path}")
 
         # Check for middleware
-        middleware_files = [f for f in self.structure.files if "middleware" in str(f.relative_path).lower()]
+        middleware_files = [f for f in self.structure.files if "middleware" in f.path_lower]
         if middleware_files:
             mw_file = middleware_files[0]
             mw_insight = ""
@@ -847,14 +922,14 @@ class Analyzer:
             if mw_file.content:
                 if "CORSMiddleware" in mw_file.content:
                     mw_insight = "CORS middleware configured"
-                if "authenticate" in mw_file.content.lower():
+                if "authenticate" in mw_file.content_lower:
                     mw_insight += ", authentication middleware present"
                 mw_what = "Before reaching the route handler, requests pass through middleware that can modify requests/responses, handle authentication, add headers, or reject invalid requests."
             steps.append(RequestFlowStep(
                 order=order,
                 location="Middleware Processing",
                 description="Request passes through middleware stack for cross-cutting concerns like CORS, authentication, logging, and error handling.",
-                file_path=str(mw_file.relative_path),
+                file_path=mw_file.path_str,
                 code_insight=mw_insight or "Middleware intercepts all requests",
                 what_happens=mw_what,
             ))
@@ -863,9 +938,9 @@ class Analyzer:
 
         # Check for router/routes - pick a representative route file
         route_files = [f for f in self.structure.files
-                      if "route" in str(f.relative_path).lower()
+                      if "route" in f.path_lower
                       and f.extension == ".py"
-                      and "__init__" not in f.relative_path.name]
+                      and "__init__" not in f.name]
         if route_files:
             # Pick the most substantial route file
             route_file = max(route_files, key=lambda x: x.line_count)
@@ -885,7 +960,7 @@ class Analyzer:
                 order=order,
                 location="Route Matching and Handler",
                 description=f"FastAPI router matches the URL path to a handler function. Found {len(route_files)} route file(s) defining the API surface.",
-                file_path=str(route_file.relative_path),
+                file_path=route_file.path_str,
                 code_insight=route_insight,
                 what_happens=route_what,
                 key_functions=route_funcs,
@@ -894,7 +969,7 @@ class Analyzer:
             touchpoints.append(f"Routes: {len(route_files)} route files with {len(endpoints) if route_file.content else 'multiple'} endpoints")
 
         # Check for dependencies
-        dep_files = [f for f in self.structure.files if "dependenc" in str(f.relative_path).lower()]
+        dep_files = [f for f in self.structure.files if "dependenc" in f.path_lower]
         if dep_files:
             dep_file = dep_files[0]
             dep_insight = ""
@@ -913,7 +988,7 @@ class Analyzer:
                 order=order,
                 location="Dependency Injection",
                 description="FastAPI resolves dependencies declared with Depends() - database sessions, authentication, permissions, and other injected resources.",
-                file_path=str(dep_file.relative_path),
+                file_path=dep_file.path_str,
                 code_insight=dep_insight or "Dependencies resolved before handler execution",
                 what_happens=dep_what,
                 key_functions=dep_funcs,
@@ -923,9 +998,9 @@ class Analyzer:
 
         # Check for services
         service_files = [f for f in self.structure.files
-                        if "service" in str(f.relative_path).lower()
+                        if "service" in f.path_lower
                         and f.extension == ".py"
-                        and "__init__" not in f.relative_path.name]
+                        and "__init__" not in f.name]
         if service_files:
             svc_file = max(service_files, key=lambda x: x.line_count)
             svc_insight = ""
@@ -945,7 +1020,7 @@ class Analyzer:
                 order=order,
                 location="Service Layer (Business Logic)",
                 description=f"Business logic executes in service classes. Found {len(service_files)} service file(s) containing domain operations.",
-                file_path=str(svc_file.relative_path),
+                file_path=svc_file.path_str,
                 code_insight=svc_insight,
                 what_happens=svc_what,
                 key_functions=svc_funcs,
@@ -955,15 +1030,15 @@ class Analyzer:
 
         # Check for models/database
         model_files = [f for f in self.structure.files
-                      if "model" in str(f.relative_path).lower()
+                      if "model" in f.path_lower
                       and f.extension == ".py"
-                      and "__init__" not in f.relative_path.name]
+                      and "__init__" not in f.name]
         if model_files:
             model_file = max(model_files, key=lambda x: x.line_count)
             model_insight = ""
             model_what = ""
             if model_file.content:
-                tables = re.findall(r'__tablename__\s*=\s*["\'](\w+)["\']', model_file.content)
+                tables = TABLENAME_PATTERN.findall(model_file.content)
                 if tables:
                     model_insight = f"Tables: {', '.join(tables[:3])}"
                 model_what = "Services interact with the database through SQLAlchemy ORM models. The ORM translates Python objects to SQL queries, handles relationships between entities, and manages the unit of work pattern for transactions."
@@ -972,7 +1047,7 @@ class Analyzer:
                 order=order,
                 location="Database Layer (ORM)",
                 description=f"Data persistence via SQLAlchemy models. Found {len(model_files)} model file(s) defining the database schema.",
-                file_path=str(model_file.relative_path),
+                file_path=model_file.path_str,
                 code_insight=model_insight or "SQLAlchemy models define database tables",
                 what_happens=model_what,
             ))
@@ -981,9 +1056,9 @@ class Analyzer:
 
         # Response serialization
         schema_files = [f for f in self.structure.files
-                       if "schema" in str(f.relative_path).lower()
+                       if "schema" in f.path_lower
                        and f.extension == ".py"
-                       and "__init__" not in f.relative_path.name]
+                       and "__init__" not in f.name]
         if schema_files:
             schema_file = max(schema_files, key=lambda x: x.line_count)
             schema_insight = ""
@@ -998,7 +1073,7 @@ class Analyzer:
                 order=order,
                 location="Response Serialization",
                 description="Response data validated and serialized through Pydantic schemas before returning JSON to client.",
-                file_path=str(schema_file.relative_path),
+                file_path=schema_file.path_str,
                 code_insight=schema_insight or "Pydantic schemas validate response shape",
                 what_happens=schema_what,
             ))
@@ -1019,7 +1094,6 @@ class Analyzer:
         first_read: list[tuple[str, str, int]] = []
         skip_files: list[tuple[str, str]] = []
         priority = 1
-        code_exts = {".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".java", ".rb", ".rs"}
         added_paths: set[str] = set()
 
         def _add(path_str: str, reason: str) -> None:
@@ -1037,8 +1111,8 @@ class Analyzer:
             "main.go", "cmd/main.go",
         }
         for f in self.structure.files:
-            if f.relative_path.name in entry_names and len(f.relative_path.parts) <= 2:
-                _add(str(f.relative_path),
+            if f.name in entry_names and len(f.relative_path.parts) <= 2:
+                _add(f.path_str,
                      "Application entry point — start here to understand how the app boots")
                 break
 
@@ -1046,13 +1120,13 @@ class Analyzer:
         config_names = {"config.py", "config.ts", "config.js", "settings.py"}
         _config_skip_dirs = {"alembic", "migrations", "node_modules", "dist", ".venv"}
         for f in self.structure.files:
-            name_lower = f.relative_path.name.lower()
+            name_lower = f.name.lower()
             if any(part in _config_skip_dirs for part in f.relative_path.parts):
                 continue
             if (name_lower in config_names or
-                ("config" in name_lower and f.extension in code_exts)) \
+                ("config" in name_lower and f.extension in CODE_FILE_EXTENSIONS)) \
                     and "__init__" not in name_lower:
-                _add(str(f.relative_path),
+                _add(f.path_str,
                      "Configuration — shows environment variables and app settings")
                 break
 
@@ -1061,11 +1135,11 @@ class Analyzer:
         _utility_keywords = {"audit", "log", "migration", "base", "mixin", "abstract", "util", "helper"}
         model_files = [
             f for f in self.structure.files
-            if ("model" in str(f.relative_path).lower()
-                or "schema" in str(f.relative_path).lower()
-                or "entity" in str(f.relative_path).lower())
-            and f.extension in code_exts
-            and "__init__" not in f.relative_path.name
+            if ("model" in f.path_lower
+                or "schema" in f.path_lower
+                or "entity" in f.path_lower)
+            and f.extension in CODE_FILE_EXTENSIONS
+            and "__init__" not in f.name
             and f.line_count > 5
         ]
         # Separate core models from utility models
@@ -1076,42 +1150,42 @@ class Analyzer:
         chosen_models = core_models if core_models else model_files
         if chosen_models:
             model_file = max(chosen_models, key=lambda x: x.line_count)
-            _add(str(model_file.relative_path),
+            _add(model_file.path_str,
                  "Core data model — understand the primary domain entities")
 
         # Priority 4: A route / controller file
         route_files = [
             f for f in self.structure.files
-            if ("route" in str(f.relative_path).lower()
-                or "controller" in str(f.relative_path).lower()
-                or "handler" in str(f.relative_path).lower()
-                or "view" in str(f.relative_path).lower())
-            and f.extension in code_exts
-            and "__init__" not in f.relative_path.name
+            if ("route" in f.path_lower
+                or "controller" in f.path_lower
+                or "handler" in f.path_lower
+                or "view" in f.path_lower)
+            and f.extension in CODE_FILE_EXTENSIONS
+            and "__init__" not in f.name
         ]
         if route_files:
             route_file = max(route_files, key=lambda x: x.line_count)
-            _add(str(route_file.relative_path),
+            _add(route_file.path_str,
                  "API routes — see what endpoints are exposed and how requests are handled")
 
         # Priority 5: A service / usecase file
         service_files = [
             f for f in self.structure.files
-            if ("service" in str(f.relative_path).lower()
-                or "usecase" in str(f.relative_path).lower()
-                or "interactor" in str(f.relative_path).lower())
-            and f.extension in code_exts
-            and "__init__" not in f.relative_path.name
+            if ("service" in f.path_lower
+                or "usecase" in f.path_lower
+                or "interactor" in f.path_lower)
+            and f.extension in CODE_FILE_EXTENSIONS
+            and "__init__" not in f.name
         ]
         if service_files:
             service_file = max(service_files, key=lambda x: x.line_count)
-            _add(str(service_file.relative_path),
+            _add(service_file.path_str,
                  "Service layer — where the core business logic lives")
 
         # Priority 6: README if present
         for f in self.structure.files:
-            if f.relative_path.name.lower() in ("readme.md", "readme.rst", "readme.txt", "readme"):
-                _add(str(f.relative_path),
+            if f.name.lower() in ("readme.md", "readme.rst", "readme.txt", "readme"):
+                _add(f.path_str,
                      "Project documentation — high-level overview and setup instructions")
                 break
 
@@ -1129,7 +1203,7 @@ class Analyzer:
 
         skip_path_set: set[str] = set()
         for f in self.structure.files:
-            path_str = str(f.relative_path)
+            path_str = f.path_str
             for pattern, reason in skip_patterns:
                 if pattern in path_str or path_str.endswith(pattern):
                     if path_str not in skip_path_set:
@@ -1139,10 +1213,10 @@ class Analyzer:
 
         # Also skip test files initially
         for f in self.structure.files:
-            path_str = str(f.relative_path)
+            path_str = f.path_str
             if path_str in skip_path_set:
                 continue
-            if ("test" in path_str.lower() or "spec" in path_str.lower()) and f.extension in code_exts:
+            if ("test" in f.path_lower or "spec" in f.path_lower) and f.extension in CODE_FILE_EXTENSIONS:
                 skip_files.append((
                     path_str,
                     "Test files — read when you need to understand expected behavior",
@@ -1153,37 +1227,35 @@ class Analyzer:
 
     def _extract_domain_entities(self) -> list[str]:
         """Extract domain entities from model files."""
-        import re
-        entities = []
+        entities: dict[str, None] = {}  # ordered set
 
         for f in self.structure.files:
             if f.content is None:
                 continue
-            if "model" in str(f.relative_path).lower() and f.extension == ".py":
+            if "model" in f.path_lower and f.extension == ".py":
                 # Look for SQLAlchemy model classes
-                class_matches = re.findall(r'class\s+(\w+)\s*\([^)]*Base[^)]*\)', f.content)
+                class_matches = SQLALCHEMY_MODEL_PATTERN.findall(f.content)
                 for match in class_matches:
                     if match not in entities and not match.startswith("_"):
-                        entities.append(match)
+                        entities[match] = None
 
                 # Look for table names
-                table_matches = re.findall(r'__tablename__\s*=\s*["\'](\w+)["\']', f.content)
+                table_matches = TABLENAME_PATTERN.findall(f.content)
                 for match in table_matches:
                     entity_name = match.replace("_", " ").title().replace(" ", "")
                     if entity_name not in entities:
-                        entities.append(f"{entity_name} (table: {match})")
+                        entities[f"{entity_name} (table: {match})"] = None
 
-        return entities[:15]
+        return list(entities)[:15]
 
     def _extract_api_endpoints(self) -> list[tuple[str, str, str]]:
         """Extract API endpoints from route files."""
-        import re
         endpoints = []
 
         for f in self.structure.files:
             if f.content is None:
                 continue
-            if "route" in str(f.relative_path).lower() and f.extension == ".py":
+            if "route" in f.path_lower and f.extension == ".py":
                 # Match FastAPI decorators like @router.get("/path")
                 patterns = [
                     r'@\w+\.(get|post|put|delete|patch)\s*\(\s*["\']([^"\']+)["\']',
@@ -1193,7 +1265,7 @@ class Analyzer:
                     matches = re.findall(pattern, f.content, re.IGNORECASE)
                     for method, path in matches:
                         # Try to find the function name/docstring for description
-                        desc = f"Endpoint in {f.relative_path.name}"
+                        desc = f"Endpoint in {f.name}"
                         endpoints.append((method.upper(), path, desc))
 
         return endpoints[:20]
@@ -1216,13 +1288,13 @@ class Analyzer:
             lines.append(f"It exposes a REST API with {len(result.api_endpoints)} endpoints ({method_summary}).")
 
         # Describe authentication if present
-        auth_files = [f for f in self.structure.files if "auth" in str(f.relative_path).lower()]
+        auth_files = [f for f in self.structure.files if "auth" in f.path_lower]
         if auth_files:
             for f in auth_files:
-                if f.content and "jwt" in f.content.lower():
+                if "jwt" in f.content_lower:
                     lines.append("Authentication is handled via JWT tokens.")
                     break
-                elif f.content and "oauth" in f.content.lower():
+                elif "oauth" in f.content_lower:
                     lines.append("Authentication uses OAuth.")
                     break
             else:
@@ -1235,7 +1307,7 @@ class Analyzer:
             lines.append("Database schema changes are managed through Alembic migrations.")
 
         # Check for background tasks
-        if any("celery" in str(f.relative_path).lower() or "task" in str(f.relative_path).lower()
+        if any("celery" in f.path_lower or "task" in f.path_lower
                for f in self.structure.files):
             lines.append("Background task processing appears to be supported.")
 
@@ -1243,17 +1315,15 @@ class Analyzer:
 
     def _build_dependency_graph(self, result: AnalysisResult) -> DependencyGraph:
         """Build a file-level dependency graph by parsing imports."""
-        import re
 
-        code_exts = {".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".java", ".rb", ".rs"}
-        code_files = [f for f in self.structure.files if f.extension in code_exts and f.content]
+        code_files = [f for f in self.structure.files if f.extension in CODE_FILE_EXTENSIONS and f.content]
 
         # Build a lookup: module path → relative file path
         # e.g. "app.core.config" → "app/core/config.py"
         path_lookup: dict[str, str] = {}
         file_set: set[str] = set()
         for f in code_files:
-            rel = str(f.relative_path)
+            rel = f.path_str
             file_set.add(rel)
             # Python: app/core/config.py → app.core.config
             if f.extension == ".py":
@@ -1277,12 +1347,12 @@ class Analyzer:
         imports_in: dict[str, int] = {}
 
         for f in code_files:
-            src = str(f.relative_path)
+            src = f.path_str
             src_dir = str(f.relative_path.parent)
 
             if f.extension == ".py":
                 # Match: from app.core.config import Settings
-                for m in re.finditer(r'^from\s+([\w.]+)\s+import', f.content, re.MULTILINE):
+                for m in PY_FROM_IMPORT_PATTERN.finditer(f.content):
                     mod = m.group(1)
                     target = self._resolve_py_import(mod, src_dir, path_lookup)
                     if target and target != src:
@@ -1290,7 +1360,7 @@ class Analyzer:
                         imports_out[src] = imports_out.get(src, 0) + 1
                         imports_in[target] = imports_in.get(target, 0) + 1
                 # Match: import app.core.config
-                for m in re.finditer(r'^import\s+([\w.]+)', f.content, re.MULTILINE):
+                for m in PY_IMPORT_PATTERN.finditer(f.content):
                     mod = m.group(1)
                     target = self._resolve_py_import(mod, src_dir, path_lookup)
                     if target and target != src:
@@ -1300,7 +1370,7 @@ class Analyzer:
 
             elif f.extension in {".js", ".ts", ".jsx", ".tsx"}:
                 # Match: import X from './path' or require('./path')
-                for m in re.finditer(r"""(?:from|require\()\s*['"]([^'"]+)['"]""", f.content):
+                for m in JS_IMPORT_PATTERN.finditer(f.content):
                     imp = m.group(1)
                     if not imp.startswith("."):
                         continue  # skip node_modules
@@ -15,6 +15,9 @@ DEFAULT_MODEL = "gpt-4o-mini"
 DEFAULT_BASE_URL = "https://api.openai.com/v1"
 DEFAULT_MAX_TOKENS = 1024
 
+# Shared client so repeated questions reuse pooled connections (and TLS sessions)
+_client = None
+
 
 def _check_httpx() -> None:
     """Check that httpx is installed, raise a helpful error if not."""
@@ -118,6 +121,15 @@ Keep answers focused, practical, and under 300 words. Use bullet points for list
 Do not make up information that isn't in the analysis."""
 
 
+def _get_client():
+    """Return the shared httpx client, creating it on first use."""
+    global _client
+    if _client is None:
+        import httpx
+        _client = httpx.Client(timeout=30.0)
+    return _client
+
+
 def ask_llm(
     structure: RepoStructure,
     analysis: AnalysisResult,
@@ -141,7 +153,6 @@ def ask_llm(
         The LLM's response as a string.
     """
     _check_httpx()
-    import httpx
 
     # Resolve config from args -> env -> defaults
     key = api_key or os.environ.get("SELITYS_API_KEY") or os.environ.get("OPENAI_API_KEY")
@@ -171,14 +182,13 @@ def ask_llm(
 
     endpoint = f"{url.rstrip('/')}/chat/completions"
 
-    response = httpx.post(
+    response = _get_client().post(
         endpoint,
         json=payload,
         headers={
             "Authorization": f"Bearer {key}",
             "Content-Type": "application/json",
         },
-        timeout=30.0,
     )
 
     if response.status_code != 200:
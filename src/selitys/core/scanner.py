@@ -1,6 +1,9 @@
 """Repository scanner - traverses and reads files from a codebase."""
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 
 from pathspec import PathSpec
@@ -95,6 +98,26 @@ class FileInfo:
     is_binary: bool = False
     read_error: str | None = None
 
+    @cached_property
+    def path_str(self) -> str:
+        """Relative path as a string, computed once per file."""
+        return str(self.relative_path)
+
+    @cached_property
+    def name(self) -> str:
+        """File name (last path component), computed once per file."""
+        return self.relative_path.name
+
+    @cached_property
+    def path_lower(self) -> str:
+        """Lowercased relative path, computed once per file."""
+        return self.path_str.lower()
+
+    @cached_property
+    def content_lower(self) -> str:
+        """Lowercased file content, computed once per file ("" if unread)."""
+        return self.content.lower() if self.content else ""
+
 
 @dataclass
 class DirectoryInfo:
@@ -121,16 +144,46 @@ class RepoStructure:
         root_files = [f for f in self.files if len(f.relative_path.parts) == 1]
         return root_dirs, root_files
 
+    @cached_property
+    def files_by_name(self) -> dict[str, list[FileInfo]]:
+        """Index of files keyed by file name (not path), in scan order."""
+        index: dict[str, list[FileInfo]] = {}
+        for f in self.files:
+            index.setdefault(f.name, []).append(f)
+        return index
+
+    @cached_property
+    def files_by_extension(self) -> dict[str, list[FileInfo]]:
+        """Index of files keyed by extension, in scan order."""
+        index: dict[str, list[FileInfo]] = {}
+        for f in self.files:
+            index.setdefault(f.extension, []).append(f)
+        return index
+
+    def clear_content_caches(self) -> None:
+        """Drop cached lowercase copies of file contents (recomputed on demand)."""
+        for f in self.files:
+            f.__dict__.pop("content_lower", None)
+
+    def release_contents(self) -> None:
+        """Drop file contents once analysis is done; metadata and line counts are kept."""
+        for f in self.files:
+            f.content = None
+        self.clear_content_caches()
+
     def get_files_by_extension(self, ext: str) -> list[FileInfo]:
         """Get all files with a specific extension."""
-        return [f for f in self.files if f.extension == ext]
+        return list(self.files_by_extension.get(ext, ()))
 
     def find_file(self, name: str) -> FileInfo | None:
         """Find a file by name (not path)."""
-        for f in self.files:
-            if f.relative_path.name == name:
-                return f
-        return None
+        matches = self.files_by_name.get(name)
+        return matches[0] if matches else None
+
+    def find_files(self, names: Iterable[str]) -> list[FileInfo]:
+        """Find all files whose name is in *names*, in scan order."""
+        matches = [f for name in set(names) for f in self.files_by_name.get(name, ())]
+        return sorted(matches, key=lambda f: f.relative_path)
 
 
 class RepoScanner:
@@ -144,9 +197,11 @@ class RepoScanner:
         respect_gitignore: bool = True,
         include_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
+        read_workers: int | None = None,
     ):
         self.repo_path = Path(repo_path).resolve()
         self.max_file_size_bytes = max_file_size_bytes
+        self.read_workers = read_workers
         self.respect_gitignore = respect_gitignore
         self._gitignore_spec = self._load_gitignore() if respect_gitignore else None
         self._include_spec = self._load_spec(include_patterns)
@@ -217,10 +272,24 @@ class RepoScanner:
         except Exception as e:
             return None, 0, str(e)
 
+    def _read_contents(self, files: list[FileInfo]) -> None:
+        """Read file contents, using a thread pool since reads are I/O bound."""
+        paths = [f.path for f in files]
+        if self.read_workers == 1 or len(paths) < 2:
+            results = list(map(self._read_file_content, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=self.read_workers) as pool:
+                results = list(pool.map(self._read_file_content, paths))
+        for f, (content, line_count, read_error) in zip(files, results):
+            f.content = content
+            f.line_count = line_count
+            f.read_error = read_error
+
     def scan(self, read_content: bool = True) -> RepoStructure:
         """Scan the repository and build the internal representation."""
         structure = RepoStructure(root_path=self.repo_path)
         languages: dict[str, int] = {}
+        to_read: list[FileInfo] = []
 
         for path in sorted(self.repo_path.rglob("*")):
             relative_path = path.relative_to(self.repo_path)
@@ -244,31 +313,29 @@ class RepoScanner:
                 is_binary = self._is_binary(path)
                 size = path.stat().st_size
 
-                content = None
-                line_count = 0
                 read_error = None
-
                 if self.max_file_size_bytes is not None and size > self.max_file_size_bytes:
                     read_error = f"Skipped: file size {size} exceeds limit {self.max_file_size_bytes}"
-                elif read_content and not is_binary:
-                    content, line_count, read_error = self._read_file_content(path)
 
                 file_info = FileInfo(
                     path=path,
                     relative_path=relative_path,
                     extension=ext,
                     size_bytes=size,
-                    content=content,
-                    line_count=line_count,
                     is_binary=is_binary,
                     read_error=read_error,
                 )
                 structure.files.append(file_info)
-                structure.total_lines += line_count
+                if read_content and not is_binary and read_error is None:
+                    to_read.append(file_info)
+
+        self._read_contents(to_read)
 
-                lang = self._detect_language(ext)
-                if lang:
-                    languages[lang] = languages.get(lang, 0) + line_count
+        for file_info in structure.files:
+            structure.total_lines += file_info.line_count
+            lang = self._detect_language(file_info.extension)
+            if lang:
+                languages[lang] = languages.get(lang, 0) + file_info.line_count
 
         structure.total_files = len(structure.files)
         structure.languages_detected = dict(sorted(languages.items(), key=lambda x: -x[1]))
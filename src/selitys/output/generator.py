@@ -1,6 +1,9 @@
 """Markdown generator for selitys output files."""
 
+import io
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, TextIO
 
@@ -95,15 +98,20 @@ class MarkdownGenerator:
             "attributes": dict(fact.attributes),
         }
 
+    @contextmanager
+    def _open_document(self, output_path: Path) -> Iterator[TextIO]:
+        """Build a document in memory and write it to *output_path* in one go."""
+        buf = io.StringIO()
+        yield buf
+        output_path.write_text(buf.getvalue(), encoding="utf-8")
+
     def _write_header(self, f: TextIO, title: str) -> None:
         """Write standard header for a markdown file."""
-        f.write(f"# {title}\n\n")
-        f.write(f"Repository: `{self.analysis.repo_name}`\n\n")
-        f.write("---\n\n")
+        f.write(f"# {title}\n\nRepository: `{self.analysis.repo_name}`\n\n---\n\n")
 
     def generate_overview(self, output_path: Path) -> None:
         """Generate selitys-overview.md."""
-        with open(output_path, "w") as f:
+        with self._open_document(output_path) as f:
             self._write_header(f, "Codebase Overview")
 
             self._write_purpose_section(f)
@@ -192,8 +200,8 @@ class MarkdownGenerator:
 
         if self.structure.languages_detected:
             f.write("**Languages:**\n")
-            for lang, lines in list(self.structure.languages_detected.items())[:5]:
-                f.write(f"- {lang}: {lines:,} lines\n")
+            languages = list(self.structure.languages_detected.items())[:5]
+            f.write("".join(f"- {lang}: {lines:,} lines\n" for lang, lines in languages))
             f.write("\n")
 
         framework_facts = self._facts_by_kind(FactKind.FRAMEWORK)
@@ -211,8 +219,7 @@ class MarkdownGenerator:
             f.write("\n")
         elif self.analysis.frameworks:
             f.write("**Frameworks and Libraries:**\n")
-            for fw in self.analysis.frameworks:
-                f.write(f"- {fw.name} ({fw.category})\n")
+            f.write("".join(f"- {fw.name} ({fw.category})\n" for fw in self.analysis.frameworks))
             f.write("\n")
             f.write(self._uncertain_line("Frameworks inferred from string matching in source files."))
 
@@ -222,14 +229,12 @@ class MarkdownGenerator:
 
         if self.analysis.top_level_dirs:
             f.write("**Directories:**\n")
-            for dir_path, desc in self.analysis.top_level_dirs.items():
-                f.write(f"- `{dir_path}/` - {desc}\n")
+            f.write("".join(f"- `{dir_path}/` - {desc}\n" for dir_path, desc in self.analysis.top_level_dirs.items()))
             f.write("\n")
 
         if self.analysis.top_level_files:
             f.write("**Key Files:**\n")
-            for file_path, desc in self.analysis.top_level_files.items():
-                f.write(f"- `{file_path}` - {desc}\n")
+            f.write("".join(f"- `{file_path}` - {desc}\n" for file_path, desc in self.analysis.top_level_files.items()))
             f.write("\n")
 
     def _write_entry_points_section(self, f: TextIO) -> None:
@@ -243,8 +248,7 @@ class MarkdownGenerator:
                 f.write(f"- `{path}` - {fact.summary}{self._evidence_note(fact)}\n")
             f.write("\n")
         elif self.analysis.entry_points:
-            for ep in self.analysis.entry_points:
-                f.write(f"- `{ep.path}` - {ep.description}\n")
+            f.write("".join(f"- `{ep.path}` - {ep.description}\n" for ep in self.analysis.entry_points))
             f.write("\n")
             f.write(self._uncertain_line("Entry points inferred from filename heuristics."))
         else:
@@ -256,14 +260,12 @@ class MarkdownGenerator:
 
         if self.analysis.config.config_files:
             f.write("**Configuration Files:**\n")
-            for cf in self.analysis.config.config_files:
-                f.write(f"- `{cf}`\n")
+            f.write("".join(f"- `{cf}`\n" for cf in self.analysis.config.config_files))
             f.write("\n")
 
         if self.analysis.config.env_vars:
             f.write("**Environment Variables:**\n")
-            for var in self.analysis.config.env_vars[:15]:
-                f.write(f"- `{var}`\n")
+            f.write("".join(f"- `{var}`\n" for var in self.analysis.config.env_vars[:15]))
             if len(self.analysis.config.env_vars) > 15:
                 f.write(f"- ... and {len(self.analysis.config.env_vars) - 15} more\n")
             f.write("\n")
@@ -281,7 +283,7 @@ class MarkdownGenerator:
 
     def generate_architecture(self, output_path: Path) -> None:
         """Generate selitys-architecture.md."""
-        with open(output_path, "w") as f:
+        with self._open_document(output_path) as f:
             self._write_header(f, "Architecture")
 
             self._write_subsystems_section(f)
@@ -300,8 +302,7 @@ class MarkdownGenerator:
                 f.write(f"{sub.description}\n\n")
                 if sub.key_files:
                     f.write("**Key files:**\n")
-                    for kf in sub.key_files:
-                        f.write(f"- `{kf}`\n")
+                    f.write("".join(f"- `{kf}`\n" for kf in sub.key_files))
                     f.write("\n")
             f.write(self._uncertain_line("Subsystems inferred from directory names and file placement."))
         else:
@@ -312,8 +313,7 @@ class MarkdownGenerator:
         f.write("## Patterns Detected\n\n")
 
         if self.analysis.patterns_detected:
-            for pattern in self.analysis.patterns_detected:
-                f.write(f"- {pattern}\n")
+            f.write("".join(f"- {pattern}\n" for pattern in self.analysis.patterns_detected))
             f.write("\n")
             f.write(self._uncertain_line("Patterns inferred from naming conventions and dependency hints."))
         else:
@@ -342,23 +342,21 @@ class MarkdownGenerator:
         f.write("## Risk Areas\n\n")
 
         if self.analysis.risk_areas:
-            by_severity = {"high": [], "medium": [], "low": []}
-            for risk in self.analysis.risk_areas:
-                by_severity[risk.severity].append(risk)
-
-            for severity in ["high", "medium", "low"]:
-                risks = by_severity[severity]
-                if risks:
+            # Stable sort keeps detection order within a severity; the analyzer
+            # already returns risks in this order, so it is a single pass
+            severity_rank = {"high": 0, "medium": 1, "low": 2}
+            severity = None
+            for risk in sorted(self.analysis.risk_areas, key=lambda r: severity_rank.get(r.severity, 3)):
+                if risk.severity != severity:
+                    severity = risk.severity
                     f.write(f"### {severity.capitalize()} Severity\n\n")
-                    for risk in risks:
-                        f.write(f"**{risk.risk_type}** - `{risk.location}`\n\n")
-                        f.write(f"{risk.description}\n\n")
+                f.write(f"**{risk.risk_type}** - `{risk.location}`\n\n{risk.description}\n\n")
         else:
             f.write("No significant risk areas detected.\n\n")
 
     def generate_request_flow(self, output_path: Path) -> None:
         """Generate selitys-request-flow.md."""
-        with open(output_path, "w") as f:
+        with self._open_document(output_path) as f:
             self._write_header(f, "Request Flow")
 
             if not self.analysis.request_flow:
@@ -397,15 +395,14 @@ class MarkdownGenerator:
 
             f.write("## Key Touchpoints\n\n")
             if flow.touchpoints:
-                for tp in flow.touchpoints:
-                    f.write(f"- {tp}\n")
+                f.write("".join(f"- {tp}\n" for tp in flow.touchpoints))
                 f.write("\n")
             else:
                 f.write("No additional touchpoints identified beyond the main flow.\n\n")
 
     def generate_first_read(self, output_path: Path) -> None:
         """Generate selitys-first-read.md."""
-        with open(output_path, "w") as f:
+        with self._open_document(output_path) as f:
             self._write_header(f, "First Read Guide")
 
             f.write("## Start Here\n\n")
@@ -413,9 +410,10 @@ class MarkdownGenerator:
             f.write("to understanding how this system works.\n\n")
 
             if self.analysis.first_read_files:
-                for path, why, priority in self.analysis.first_read_files:
-                    f.write(f"### {priority}. `{path}`\n\n")
-                    f.write(f"{why}\n\n")
+                f.write("".join(
+                    f"### {priority}. `{path}`\n\n{why}\n\n"
+                    for path, why, priority in self.analysis.first_read_files
+                ))
                 f.write(self._uncertain_line("Reading order inferred from file names and common conventions."))
             else:
                 f.write("No clear reading order could be determined. Start with any `main.py` ")
@@ -429,8 +427,7 @@ class MarkdownGenerator:
                 if "service" in sub.name.lower() or "core" in sub.name.lower()
             ]
             if service_dirs:
-                for sub in service_dirs[:3]:
-                    f.write(f"- `{sub.directory}/` - {sub.description}\n")
+                f.write("".join(f"- `{sub.directory}/` - {sub.description}\n" for sub in service_dirs[:3]))
                 f.write("\n")
             else:
                 f.write("The core logic location is not clearly separated. Look for files ")
@@ -448,8 +445,7 @@ class MarkdownGenerator:
 
                 for reason, paths in by_reason.items():
                     f.write(f"**{reason}:**\n")
-                    for path in paths[:5]:
-                        f.write(f"- `{path}`\n")
+                    f.write("".join(f"- `{path}`\n" for path in paths[:5]))
                     if len(paths) > 5:
                         f.write(f"- ... and {len(paths) - 5} more\n")
                     f.write("\n")
@@ -467,7 +463,7 @@ class MarkdownGenerator:
 
     def generate_config(self, output_path: Path) -> None:
         """Generate selitys-config.md."""
-        with open(output_path, "w") as f:
+        with self._open_document(output_path) as f:
             self._write_header(f, "Configuration Guide")
 
             f.write("## Overview\n\n")
@@ -518,8 +514,7 @@ class MarkdownGenerator:
 
             elif self.analysis.config.env_vars:
                 f.write("The following environment variables are used:\n\n")
-                for var in self.analysis.config.env_vars:
-                    f.write(f"- `{var}`\n")
+                f.write("".join(f"- `{var}`\n" for var in self.analysis.config.env_vars))
                 f.write("\n")
             else:
                 f.write("No environment variables detected.\n\n")
@@ -544,8 +539,7 @@ class MarkdownGenerator:
                 if secret_vars:
                     f.write("## Security Notes\n\n")
                     f.write("The following variables appear to contain sensitive data:\n\n")
-                    for var in secret_vars:
-                        f.write(f"- `{var.name}`\n")
+                    f.write("".join(f"- `{var.name}`\n" for var in secret_vars))
                     f.write("\n")
                     f.write("Ensure these are properly secured and never exposed in logs or error messages.\n")
 
@@ -713,5 +707,4 @@ class MarkdownGenerator:
                 "touchpoints": flow.touchpoints,
             }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        output_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
@@ -80,6 +80,90 @@ class TestAnalyzerBasic:
         assert len(graph.edges) > 0
 
 
+class TestSubsystems:
+    def test_key_files_in_scan_order(self, tmp_path):
+        services = tmp_path / "services"
+        (services / "billing").mkdir(parents=True)
+        (services / "__init__.py").write_text("")
+        (services / "billing" / "invoices.py").write_text("")
+        (services / "billing-jobs.py").write_text("")
+        (services / "users.py").write_text("")
+        (tmp_path / "services_extra.py").write_text("")
+        structure = RepoScanner(tmp_path).scan()
+        result = Analyzer(structure).analyze()
+        sub = next(s for s in result.subsystems if s.directory == "services")
+        assert sub.key_files == [
+            "services/billing/invoices.py",
+            "services/billing-jobs.py",
+            "services/users.py",
+        ]
+
+
+class TestEntryPoints:
+    def test_descriptions_and_placement_rules(self, tmp_path):
+        (tmp_path / "src" / "lib" / "app").mkdir(parents=True)
+        (tmp_path / "main.py").write_text("import uvicorn\n")
+        (tmp_path / "src" / "index.js").write_text("const express = require('express');\n")
+        (tmp_path / "src" / "lib" / "index.js").write_text("")
+        (tmp_path / "src" / "lib" / "app" / "layout.tsx").write_text("")
+        (tmp_path / "src" / "layout.tsx").write_text("")
+        structure = RepoScanner(tmp_path).scan()
+        entry_points = {ep.path: ep.description for ep in Analyzer(structure).analyze().entry_points}
+        assert entry_points == {
+            "main.py": "ASGI server entry point (likely runs with uvicorn)",
+            "src/index.js": "Express server entry point",
+            "src/lib/app/layout.tsx": "Next.js App Router layout",
+        }
+
+
+class TestPatterns:
+    def test_dependency_injection_from_python_source(self, tmp_path):
+        (tmp_path / "users.py").write_text("def get_user(db = Depends(get_db)):\n    pass\n")
+        structure = RepoScanner(tmp_path).scan()
+        assert "Dependency injection" in Analyzer(structure).analyze().patterns_detected
+
+    def test_dependency_injection_ignores_docs(self, tmp_path):
+        (tmp_path / "README.md").write_text("Use `Depends(get_db)` in your routes.\n")
+        (tmp_path / "users.py").write_text("def get_user():\n    pass\n")
+        structure = RepoScanner(tmp_path).scan()
+        assert "Dependency injection" not in Analyzer(structure).analyze().patterns_detected
+
+    def test_domain_entities_from_models(self, tmp_path):
+        (tmp_path / "models.py").write_text(
+            "class User(Base):\n"
+            "    __tablename__ = 'users'\n"
+            "class _Mixin(Base):\n"
+            "    pass\n"
+            "class AuditLog(Base):\n"
+            '    __tablename__ = "audit_logs"\n'
+        )
+        structure = RepoScanner(tmp_path).scan()
+        assert Analyzer(structure).analyze().domain_entities == [
+            "User", "AuditLog", "Users (table: users)", "AuditLogs (table: audit_logs)",
+        ]
+
+
+class TestRiskAreas:
+    def test_cap_keeps_highest_severity(self, tmp_path):
+        for i in range(10):
+            (tmp_path / f"a_big_{i}.py").write_text("x = 1\n" * 600)
+        for i in range(35):
+            (tmp_path / f"b_eval_{i}.py").write_text("eval(data)\n")
+        structure = RepoScanner(tmp_path).scan()
+        risks = Analyzer(structure).analyze().risk_areas
+        assert len(risks) == 30
+        assert {r.severity for r in risks} == {"high"}
+        assert risks[0].location == "b_eval_0.py"
+
+    def test_minified_bundles_skip_content_checks(self, tmp_path):
+        (tmp_path / "vendor.min.js").write_text("eval(payload);" * 10)
+        (tmp_path / "app.js").write_text("eval(payload);\n")
+        structure = RepoScanner(tmp_path).scan()
+        locations = {r.location for r in Analyzer(structure).analyze().risk_areas}
+        assert "app.js" in locations
+        assert "vendor.min.js" not in locations
+
+
 class TestDependencyGraph:
     def test_python_edges_detected(self, py_repo):
         structure = RepoScanner(py_repo).scan()
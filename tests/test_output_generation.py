@@ -1,6 +1,7 @@
 import json
 import tempfile
 import unittest
+import unittest.mock
 from pathlib import Path
 import sys
 
@@ -8,7 +9,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "src"))
 
 from selitys import __version__  # noqa: E402
-from selitys.core.analyzer import Analyzer  # noqa: E402
+from selitys.core.analyzer import Analyzer, RiskArea  # noqa: E402
 from selitys.core.scanner import RepoScanner  # noqa: E402
 from selitys.output.generator import MarkdownGenerator  # noqa: E402
 
@@ -49,5 +50,50 @@ class TestOutputGeneration(unittest.TestCase):
         self.assertGreater(len(data["facts"]), 0)
 
 
+class TestDocumentWriting(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp.name)
+        (self.tmp_path / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()\n")
+        structure = RepoScanner(self.tmp_path).scan()
+        self.generator = MarkdownGenerator(structure, Analyzer(structure).analyze())
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_failed_generation_keeps_previous_file(self) -> None:
+        output_path = self.tmp_path / "selitys-overview.md"
+        output_path.write_text("previous\n")
+
+        with unittest.mock.patch.object(self.generator, "_write_stats_section", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.generator.generate_overview(output_path)
+
+        self.assertEqual(output_path.read_text(encoding="utf-8"), "previous\n")
+        self.generator.generate_overview(output_path)
+        self.assertIn("## Quick Stats", output_path.read_text(encoding="utf-8"))
+
+    def test_risks_grouped_by_severity(self) -> None:
+        self.generator.analysis.risk_areas = [
+            RiskArea("a.py", "Large file", "first low", "low"),
+            RiskArea("b.py", "Use of eval()", "only high", "high"),
+            RiskArea("c.py", "Large file", "second low", "low"),
+        ]
+        output_path = self.tmp_path / "selitys-architecture.md"
+        self.generator.generate_architecture(output_path)
+        risks = output_path.read_text(encoding="utf-8").split("## Risk Areas\n\n")[1]
+
+        self.assertEqual(
+            [line for line in risks.splitlines() if line.startswith(("###", "**"))],
+            [
+                "### High Severity",
+                "**Use of eval()** - `b.py`",
+                "### Low Severity",
+                "**Large file** - `a.py`",
+                "**Large file** - `c.py`",
+            ],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
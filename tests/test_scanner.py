@@ -80,6 +80,28 @@ class TestRepoScanner:
         rel_paths = {str(f.relative_path) for f in structure.files}
         assert "README.md" not in rel_paths
 
+    def test_lowercase_views(self, mini_repo):
+        structure = RepoScanner(mini_repo).scan()
+        main = structure.find_file("main.py")
+        assert main.path_lower == "app/main.py"
+        assert "from fastapi import fastapi" in main.content_lower
+        readme = structure.find_file("README.md")
+        assert readme.path_lower == "readme.md"
+        structure.clear_content_caches()
+        assert "content_lower" not in vars(main)
+        assert "from fastapi import fastapi" in main.content_lower
+
+    def test_release_contents_keeps_metadata(self, mini_repo):
+        structure = RepoScanner(mini_repo).scan()
+        main = structure.find_file("main.py")
+        line_count = main.line_count
+        assert main.content_lower
+        structure.release_contents()
+        assert main.content is None
+        assert main.content_lower == ""
+        assert main.line_count == line_count
+        assert structure.total_lines > 0
+
     def test_get_top_level_items(self, mini_repo):
         scanner = RepoScanner(mini_repo)
         structure = scanner.scan()
@@ -94,3 +116,24 @@ class TestRepoScanner:
         assert found is not None
         assert found.relative_path.name == "main.py"
         assert structure.find_file("nonexistent.py") is None
+
+    def test_find_files_returns_scan_order(self, mini_repo):
+        (mini_repo / "app" / "api").mkdir()
+        (mini_repo / "app" / "api" / "main.py").write_text("")
+        structure = RepoScanner(mini_repo).scan()
+        found = structure.find_files(["main.py", "config.py", "missing.py"])
+        assert [str(f.relative_path) for f in found] == [
+            "app/api/main.py",
+            "app/config.py",
+            "app/main.py",
+        ]
+        assert {f.relative_path.name for f in structure.get_files_by_extension(".md")} == {"README.md"}
+
+    def test_threaded_read_matches_serial(self, mini_repo):
+        serial = RepoScanner(mini_repo, read_workers=1).scan()
+        threaded = RepoScanner(mini_repo, read_workers=4).scan()
+        assert [(f.path_str, f.content, f.line_count) for f in serial.files] == [
+            (f.path_str, f.content, f.line_count) for f in threaded.files
+        ]
+        assert serial.languages_detected == threaded.languages_detected
+        assert serial.total_lines == threaded.total_lines